@@ -8,20 +8,33 @@ Saves anime details and episodes in organized folder structure.
 Usage:
     python anime_episode_scraper.py --input zoroto_complete.json
     python anime_episode_scraper.py --input zoroto_complete.json --limit 10 --resume
+    python anime_episode_scraper.py --input zoroto_complete.json --concurrency 20
+    python anime_episode_scraper.py --input zoroto_complete.json --refresh
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
+import asyncio
+import atexit
+import aiohttp
+import gzip
+import importlib.util
+from lxml import etree
 import time
 import argparse
 import logging
 import os
+import queue
+import random
 import re
-from typing import List, Dict, Optional
+import threading
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urlparse
 import hashlib
+from itertools import chain, islice
+from concurrent.futures import ThreadPoolExecutor
+
+from data_io import json_dumps, json_loads, load_url_progress, open_log
+from html_utils import has_class, make_url_joiner, own_string, parse_page, visible_text
 
 try:
     import toon
@@ -29,6 +42,15 @@ try:
 except ImportError:
     TOON_AVAILABLE = False
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# aiodns is never used directly; installed, it backs aiohttp.AsyncResolver
+AIODNS_AVAILABLE = importlib.util.find_spec('aiodns') is not None
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,26 +62,90 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used on every scraped page
+_EP_HREF_RE = re.compile(r'episode|ep-?\d+', re.IGNORECASE)
+_EP_NUM_RE = re.compile(r'ep(?:isode)?-?(\d+)', re.IGNORECASE)
+_STATUS_RE = re.compile(r'Status', re.IGNORECASE)
+_UNSAFE_FN_RE = re.compile(r'[<>:"/\\|?*]')
+
+# Pages are queried with compiled XPath, so node selection runs in C and only
+# matched elements become Python objects
+_EPLISTER_LINKS_XPATH = etree.XPath(f"(//div[{has_class('eplister')}])[1]//a")
+_EP_UL_LINKS_XPATH = etree.XPath(
+    "//ul[contains(@class, 'episode') or contains(@class, 'eps')]//a[@href]"
+)
+_DATA_LINKS_XPATH = etree.XPath("//a[@data-episode]")
+# Both _EP_HREF_RE alternatives contain 'ep'; the regex is applied to these candidates
+_EP_HREF_CANDIDATES_XPATH = etree.XPath("//a[contains(translate(@href, 'EP', 'ep'), 'ep')]")
+_EPL_NUM_XPATH = etree.XPath(f"(.//div[{has_class('epl-num')}])[1]")
+_EPL_TITLE_XPATH = etree.XPath(f"(.//div[{has_class('epl-title')}])[1]")
+_NUMSCORE_XPATH = etree.XPath(f"(.//div[{has_class('numscore')}])[1]")
+# Every node extract_anime_metadata looks at, in document order, in one query
+_METADATA_XPATH = etree.XPath(
+    "//h1 | //div[@class or @itemprop = 'description'] | //a[contains(@href, '/genre/')] | //span"
+)
+
+# Transient HTTP statuses worth retrying, and the retry budget per page
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 5
+_MAX_BACKOFF = 30.0
+
+
+def _sanitize_filename(title: str) -> str:
+    """Create a safe filename from anime title"""
+    # Remove unsafe characters, then strip and join whitespace runs with '_'
+    # (str.split() treats the same characters as whitespace as re's \s)
+    safe = '_'.join(_UNSAFE_FN_RE.sub('', title).split())
+    # Limit length
+    return safe[:200] or "unnamed"
+
+
+def _read_gzip(path: Path) -> bytes:
+    """Read and decompress a gzip file"""
+    with gzip.open(path, 'rb') as f:
+        return f.read()
+
+
+def _url_hash(url: str) -> str:
+    """Get short hash of URL for unique identification"""
+    # Non-cryptographic use: a 4-byte BLAKE2b digest is 8 hex chars with no truncation
+    return hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+
+
+def _anime_slug(title: str, url: str) -> str:
+    """Get the output file stem for an anime (title plus URL hash to ensure uniqueness)"""
+    return f"{_sanitize_filename(title)}_{_url_hash(url)}"
+
 
 class AnimeEpisodeScraper:
     """Scraper for extracting episode URLs from anime pages"""
     
-    def __init__(self, output_dir: str = "anime_data", delay: float = 1.5, output_format: str = "json"):
+    def __init__(self, output_dir: str = "anime_data", delay: float = 1.5, output_format: str = "json",
+                 concurrency: int = 10, refresh: bool = False):
         """
         Initialize the scraper.
         
         Args:
             output_dir: Directory to save anime data
-            delay: Delay between requests in seconds
+            delay: Minimum delay between requests to the same host in seconds
             output_format: Output format - 'json' or 'toon'
+            concurrency: Maximum number of anime pages in flight at once
+            refresh: Ignore cached HTML and re-download every page
         """
         self.output_dir = Path(output_dir)
         self.delay = delay
         self.output_format = output_format
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.concurrency = concurrency
+        self.refresh = refresh
+        self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        }
+        # Created inside the event loop by run()
+        self.session: Optional[aiohttp.ClientSession] = None
+        # Per-host rate limiting: earliest loop time the next request may start
+        self._host_next: Dict[str, float] = {}
+        # extract_page() runs here so fetches keep going while a page is parsed
+        self._parse_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='anime-parse')
         
         # Create output directories
         self.output_dir.mkdir(exist_ok=True)
@@ -68,29 +154,55 @@ class AnimeEpisodeScraper:
         self.episodes_dir = self.output_dir / "episodes"
         self.episodes_dir.mkdir(exist_ok=True)
         
-        # Progress tracking
-        self.progress_file = self.output_dir / "progress.json"
+        # Progress tracking (append-only JSONL log, one {"u": url} record per line)
+        self.progress_file = self.output_dir / "progress.jsonl"
+        self.legacy_progress_file = self.output_dir / "progress.json"
         self.completed = self.load_progress()
+        self._progress_fp = open_log(self.progress_file, buffering=0)
+        
+        # Single writer thread for anime files and progress lines. One FIFO queue
+        # keeps a progress record behind the anime file it refers to.
+        self._writeq: queue.Queue = queue.Queue(maxsize=256)
+        self._writer = threading.Thread(target=self._writer_loop, name='anime-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
         
     def load_progress(self) -> set:
         """Load previously completed anime URLs"""
-        if self.progress_file.exists():
-            try:
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return set(data.get('completed', []))
-            except Exception as e:
-                logger.warning(f"Could not load progress file: {e}")
-        return set()
+        return load_url_progress(self.progress_file, self.legacy_progress_file)
     
     def save_progress(self, url: str):
-        """Save progress after completing an anime"""
+        """Save progress after completing an anime (queues one log line)"""
         self.completed.add(url)
-        try:
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump({'completed': list(self.completed)}, f, indent=2)
-        except Exception as e:
-            logger.error(f"Could not save progress: {e}")
+        self._writeq.put((self.progress_file, json_dumps({'u': url}) + b'\n'))
+    
+    def _writer_loop(self):
+        """Drain the write queue: append progress lines, write anime files whole"""
+        while True:
+            path, payload = self._writeq.get()
+            try:
+                if path == self.progress_file:
+                    self._progress_fp.write(payload)
+                else:
+                    with open(path, 'wb') as f:
+                        f.write(payload)
+                    if path.parent == self.episodes_dir:
+                        logger.info(f"Saved episodes data to: {path}")
+            except Exception as e:
+                logger.error(f"Error writing {path}: {e}")
+            finally:
+                self._writeq.task_done()
+    
+    def flush(self):
+        """Block until every queued write has reached disk"""
+        self._writeq.join()
+    
+    def close(self):
+        """Stop the parse pool, flush pending writes and close the progress log"""
+        self._parse_pool.shutdown()
+        if not self._progress_fp.closed:
+            self.flush()
+            self._progress_fp.close()
     
     def sanitize_filename(self, title: str) -> str:
         """
@@ -102,167 +214,276 @@ class AnimeEpisodeScraper:
         Returns:
             Safe filename string
         """
-        # Remove or replace unsafe characters
-        safe = re.sub(r'[<>:"/\\|?*]', '', title)
-        safe = re.sub(r'\s+', '_', safe.strip())
-        # Limit length
-        if len(safe) > 200:
-            safe = safe[:200]
-        return safe or "unnamed"
+        return _sanitize_filename(title)
     
     def get_url_hash(self, url: str) -> str:
         """Get short hash of URL for unique identification"""
-        return hashlib.md5(url.encode()).hexdigest()[:8]
+        return _url_hash(url)
+    
+    async def wait_for_host(self, url: str):
+        """
+        Wait for this request's slot on the URL's host.
+        
+        Each call reserves the host's next start time and pushes it forward by
+        ``self.delay``, so requests to one host are spaced ``delay`` apart no
+        matter how many workers are running while other hosts are unaffected.
+        """
+        host = urlparse(url).netloc
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # No await between read and write, so the reservation is atomic on the loop
+        start = max(now, self._host_next.get(host, now))
+        self._host_next[host] = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+    
+    def html_cache_path(self, url: str) -> Path:
+        """Get the gzip cache file for a page (full 128-bit key, collisions would serve the wrong page)"""
+        return self.html_dir / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.html.gz"
+    
+    @staticmethod
+    def retry_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Get how long to wait before retrying a failed fetch.
+        
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            retry_after: Retry-After header of the response, if any
+            
+        Returns:
+            Seconds to sleep: the server's Retry-After when it gives one in
+            seconds, otherwise exponential backoff with jitter
+        """
+        if retry_after and retry_after.strip().isdigit():
+            return min(_MAX_BACKOFF, float(retry_after))
+        return min(_MAX_BACKOFF, 2 ** attempt + random.random())
     
-    def fetch_anime_page(self, url: str) -> Optional[BeautifulSoup]:
+    async def fetch_anime_page(self, url: str) -> Optional[bytes]:
         """
-        Fetch an anime page.
+        Fetch an anime page, serving it from the gzip HTML cache when present.
+        
+        Connection errors, timeouts and 429/5xx responses are retried up to
+        ``_MAX_ATTEMPTS`` times with exponential backoff (honoring Retry-After).
         
         Args:
             url: URL of anime page
             
         Returns:
-            BeautifulSoup object or None if failed
+            Page HTML as UTF-8 bytes or None if failed
         """
-        try:
-            logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
-        except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {e}")
-            return None
+        cache_file = self.html_cache_path(url)
+        if not self.refresh and cache_file.exists():
+            try:
+                # Decompressing is CPU work; the parse pool keeps it off the event loop
+                content = await asyncio.get_running_loop().run_in_executor(
+                    self._parse_pool, _read_gzip, cache_file
+                )
+                logger.info(f"Using cached page: {url}")
+                return content
+            except (OSError, EOFError) as e:
+                logger.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+        
+        for attempt in range(_MAX_ATTEMPTS):
+            retry_after = None
+            try:
+                await self.wait_for_host(url)
+                logger.info(f"Fetching: {url}")
+                async with self.session.get(url) as response:
+                    if response.status in _RETRY_STATUSES:
+                        retry_after = response.headers.get('Retry-After')
+                        error = f"HTTP {response.status}"
+                    else:
+                        response.raise_for_status()
+                        content = await response.read()
+                        encoding = response.charset or 'utf-8'
+                        break
+            except aiohttp.ClientResponseError as e:
+                # Non-transient status (404 etc.), retrying will not help
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+            
+            if attempt == _MAX_ATTEMPTS - 1:
+                logger.error(f"Error fetching {url}: {error} (gave up after {_MAX_ATTEMPTS} attempts)")
+                return None
+            wait = self.retry_delay(attempt, retry_after)
+            logger.warning(f"Error fetching {url}: {error}, retrying in {wait:.1f}s")
+            await asyncio.sleep(wait)
+        
+        # The cache is always UTF-8 so cached pages parse without a charset header
+        if encoding.lower() not in ('utf-8', 'utf8'):
+            content = content.decode(encoding, errors='replace').encode('utf-8')
+        # compresslevel=1 is close to memcpy speed and still shrinks HTML ~4-5x
+        payload = gzip.compress(content, compresslevel=1)
+        await asyncio.get_running_loop().run_in_executor(None, self._writeq.put, (cache_file, payload))
+        
+        return content
+    
+    def collect_episode_links(self, tree: etree._Element) -> Tuple[list, list, list, list]:
+        """
+        Select the <a> elements for each episode listing pattern.
+        
+        Args:
+            tree: Parsed page
+            
+        Returns:
+            Links inside the first div.eplister, links with an href inside an
+            episode <ul>, links with a data-episode attribute, and links whose
+            href looks like an episode URL (all in document order)
+        """
+        href_links = [a for a in _EP_HREF_CANDIDATES_XPATH(tree) if _EP_HREF_RE.search(a.get('href'))]
+        return _EPLISTER_LINKS_XPATH(tree), _EP_UL_LINKS_XPATH(tree), _DATA_LINKS_XPATH(tree), href_links
     
-    def extract_episodes(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
+    def extract_episodes(self, tree: etree._Element, base_url: str) -> List[Dict[str, str]]:
         """
         Extract episode information from anime page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed page
             base_url: Base URL for resolving relative links
             
         Returns:
             List of episode dictionaries with episode number and URL
         """
         episodes = []
+        join = make_url_joiner(base_url)
         
         # Try multiple patterns for episode listings
+        eplister_links, ul_links, data_links, href_links = self.collect_episode_links(tree)
         
         # Pattern 1: Episode list in <div class="eplister">
-        eplister = soup.find('div', class_='eplister')
-        if eplister:
-            episode_links = eplister.find_all('a')
-            for link in episode_links:
-                href = link.get('href')
-                if href:
-                    # Try to extract episode number
-                    ep_num_div = link.find('div', class_='epl-num')
-                    ep_num = ep_num_div.get_text(strip=True) if ep_num_div else None
-                    
-                    # Try to get episode title
-                    ep_title_div = link.find('div', class_='epl-title')
-                    ep_title = ep_title_div.get_text(strip=True) if ep_title_div else None
-                    
-                    episodes.append({
-                        'episode_number': ep_num or f"Episode {len(episodes) + 1}",
-                        'episode_title': ep_title,
-                        'url': urljoin(base_url, href)
-                    })
+        for link in eplister_links:
+            href = link.get('href')
+            if href:
+                # Try to extract episode number
+                ep_num_div = _EPL_NUM_XPATH(link)
+                ep_num = visible_text(ep_num_div[0]) if ep_num_div else None
+                
+                # Try to get episode title
+                ep_title_div = _EPL_TITLE_XPATH(link)
+                ep_title = visible_text(ep_title_div[0]) if ep_title_div else None
+                
+                episodes.append({
+                    'episode_number': ep_num or f"Episode {len(episodes) + 1}",
+                    'episode_title': ep_title,
+                    'url': join(href)
+                })
         
         # Pattern 2: Episode list in <ul> with episode links
         if not episodes:
-            episode_lists = soup.find_all('ul', class_=re.compile(r'episode|eps'))
-            for ul in episode_lists:
-                links = ul.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href')
-                    text = link.get_text(strip=True)
-                    if href and ('episode' in href.lower() or 'ep' in href.lower()):
-                        episodes.append({
-                            'episode_number': text or f"Episode {len(episodes) + 1}",
-                            'episode_title': None,
-                            'url': urljoin(base_url, href)
-                        })
+            for link in ul_links:
+                href = link.get('href')
+                text = visible_text(link)
+                if href and ('episode' in href.lower() or 'ep' in href.lower()):
+                    episodes.append({
+                        'episode_number': text or f"Episode {len(episodes) + 1}",
+                        'episode_title': None,
+                        'url': join(href)
+                    })
         
         # Pattern 3: Episode links with data attributes
         if not episodes:
-            ep_links = soup.find_all('a', {'data-episode': True})
-            for link in ep_links:
+            for link in data_links:
                 href = link.get('href')
                 ep_num = link.get('data-episode')
                 if href:
                     episodes.append({
                         'episode_number': ep_num or f"Episode {len(episodes) + 1}",
-                        'episode_title': link.get_text(strip=True),
-                        'url': urljoin(base_url, href)
+                        'episode_title': visible_text(link),
+                        'url': join(href)
                     })
         
         # Pattern 4: Direct episode links in the page
         if not episodes:
-            all_links = soup.find_all('a', href=re.compile(r'episode|ep-?\d+', re.IGNORECASE))
-            for link in all_links:
+            for link in href_links:
                 href = link.get('href')
-                if href:
-                    # Extract episode number from URL or text
-                    ep_match = re.search(r'ep(?:isode)?-?(\d+)', href, re.IGNORECASE)
-                    ep_num = ep_match.group(1) if ep_match else None
-                    
-                    episodes.append({
-                        'episode_number': f"Episode {ep_num}" if ep_num else link.get_text(strip=True),
-                        'episode_title': None,
-                        'url': urljoin(base_url, href)
-                    })
+                # Extract episode number from URL or text
+                ep_match = _EP_NUM_RE.search(href)
+                ep_num = ep_match.group(1) if ep_match else None
+                
+                episodes.append({
+                    'episode_number': f"Episode {ep_num}" if ep_num else visible_text(link),
+                    'episode_title': None,
+                    'url': join(href)
+                })
         
         logger.info(f"Found {len(episodes)} episodes")
         return episodes
     
-    def extract_anime_metadata(self, soup: BeautifulSoup) -> Dict[str, any]:
+    def extract_page(self, content: bytes, url: str) -> Tuple[Dict[str, any], List[Dict[str, str]]]:
+        """
+        Parse a page and extract its metadata and episodes (runs on the parse pool).
+        
+        Args:
+            content: Page HTML as UTF-8 bytes
+            url: URL of the page, used to resolve relative links
+            
+        Returns:
+            Tuple of (metadata, episodes)
+        """
+        tree = parse_page(content)
+        return self.extract_anime_metadata(tree), self.extract_episodes(tree, url)
+    
+    def extract_anime_metadata(self, tree: etree._Element) -> Dict[str, any]:
         """
         Extract metadata from anime page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed page
             
         Returns:
             Dictionary with anime metadata
         """
+        h1_title = h1_any = div_content = div_desc = status_elem = rating_elem = None
+        genres = []
+        
+        # One XPath query returns every candidate node; dispatch on the tag
+        for node in _METADATA_XPATH(tree):
+            tag = node.tag
+            if tag == 'a':
+                genres.append(visible_text(node))
+            elif tag == 'div':
+                classes = (node.get('class') or '').split()
+                if div_content is None and 'entry-content' in classes:
+                    div_content = node
+                elif rating_elem is None and 'rating' in classes:
+                    rating_elem = node
+                if div_desc is None and node.get('itemprop') == 'description':
+                    div_desc = node
+            elif tag == 'span':
+                if status_elem is None:
+                    string = own_string(node)
+                    if string and _STATUS_RE.search(string):
+                        status_elem = node
+            elif tag == 'h1':
+                if h1_any is None:
+                    h1_any = node
+                if h1_title is None and 'entry-title' in (node.get('class') or '').split():
+                    h1_title = node
+        
         metadata = {}
         
-        # Try to get anime title
-        title_elem = soup.find('h1', class_='entry-title')
-        if not title_elem:
-            title_elem = soup.find('h1')
-        metadata['title'] = title_elem.get_text(strip=True) if title_elem else None
+        title_elem = h1_title if h1_title is not None else h1_any
+        metadata['title'] = visible_text(title_elem) if title_elem is not None else None
         
-        # Try to get description
-        desc_elem = soup.find('div', class_='entry-content')
-        if not desc_elem:
-            desc_elem = soup.find('div', itemprop='description')
-        metadata['description'] = desc_elem.get_text(strip=True) if desc_elem else None
+        desc_elem = div_content if div_content is not None else div_desc
+        metadata['description'] = visible_text(desc_elem) if desc_elem is not None else None
         
-        # Try to get genres
-        genres = []
-        genre_links = soup.find_all('a', href=re.compile(r'/genre/'))
-        for link in genre_links:
-            genres.append(link.get_text(strip=True))
         metadata['genres'] = genres
         
-        # Try to get status
-        status_elem = soup.find('span', string=re.compile(r'Status', re.IGNORECASE))
-        if status_elem:
-            status_parent = status_elem.find_parent()
-            if status_parent:
-                metadata['status'] = status_parent.get_text(strip=True).replace('Status:', '').strip()
+        if status_elem is not None:
+            status_parent = status_elem.getparent()
+            if status_parent is not None:
+                metadata['status'] = visible_text(status_parent).replace('Status:', '').strip()
         
-        # Try to get rating
-        rating_elem = soup.find('div', class_='rating')
-        if rating_elem:
-            score = rating_elem.find('div', class_='numscore')
-            metadata['rating'] = score.get_text(strip=True) if score else None
+        if rating_elem is not None:
+            score = _NUMSCORE_XPATH(rating_elem)
+            metadata['rating'] = visible_text(score[0]) if score else None
         
         return metadata
     
-    def scrape_anime(self, anime: Dict[str, str]) -> Optional[Dict[str, any]]:
+    async def scrape_anime(self, anime: Dict[str, str]) -> Optional[Dict[str, any]]:
         """
         Scrape a single anime page.
         
@@ -281,13 +502,14 @@ class AnimeEpisodeScraper:
             return None
         
         # Fetch page
-        soup = self.fetch_anime_page(url)
-        if not soup:
+        content = await self.fetch_anime_page(url)
+        if content is None:
             return None
         
-        # Extract data
-        metadata = self.extract_anime_metadata(soup)
-        episodes = self.extract_episodes(soup, url)
+        # Extract data off the event loop so parsing never stalls other fetches
+        metadata, episodes = await asyncio.get_running_loop().run_in_executor(
+            self._parse_pool, self.extract_page, content, url
+        )
         
         # Prepare result
         result = {
@@ -301,20 +523,15 @@ class AnimeEpisodeScraper:
         
         return result
     
-    def save_anime_data(self, anime_data: Dict[str, any]):
+    def save_anime_data(self, anime_data: Dict[str, any], slug: Optional[str] = None):
         """
-        Save anime data to files.
+        Serialize anime data and queue it for the writer thread.
         
         Args:
             anime_data: Dictionary with anime data
+            slug: File stem precomputed by load_anime_list (derived here if missing)
         """
-        title = anime_data['title']
-        url = anime_data['url']
-        url_hash = self.get_url_hash(url)
-        safe_title = self.sanitize_filename(title)
-        
-        # Create filename with hash to ensure uniqueness
-        filename = f"{safe_title}_{url_hash}"
+        filename = slug or _anime_slug(anime_data['title'], anime_data['url'])
         
         # Determine file extension based on format
         ext = '.toon' if self.output_format == 'toon' else '.json'
@@ -322,64 +539,66 @@ class AnimeEpisodeScraper:
         
         try:
             if self.output_format == 'toon' and TOON_AVAILABLE:
-                toon_str = toon.encode(anime_data)
-                with open(episodes_file, 'w', encoding='utf-8') as f:
-                    f.write(toon_str)
+                payload = toon.encode(anime_data).encode('utf-8')
             else:
-                with open(episodes_file, 'w', encoding='utf-8') as f:
-                    json.dump(anime_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved episodes data to: {episodes_file}")
+                payload = json_dumps(anime_data, indent=True)
         except Exception as e:
             logger.error(f"Error saving episodes file: {e}")
+            return
+        
+        # Written by the writer thread; blocks only when the queue is full
+        self._writeq.put((episodes_file, payload))
     
-    def scrape_all(self, anime_list: List[Dict[str, str]], limit: Optional[int] = None, resume: bool = True):
+    async def scrape_all(self, anime_list: Iterable[Dict[str, str]], limit: Optional[int] = None, resume: bool = True):
         """
-        Scrape all anime from the list.
+        Scrape all anime from the list concurrently.
+        
+        ``self.concurrency`` workers pull from the same iterator, so the list
+        can be a lazy stream and is never materialized in memory.
+        Must be awaited from run(), which owns the HTTP session.
         
         Args:
-            anime_list: List of anime dictionaries
-            limit: Maximum number to scrape (None for all)
+            anime_list: Iterable of anime dictionaries
+            limit: Maximum number to scrape (None or 0 for all)
             resume: Whether to resume from previous run
         """
-        total = len(anime_list)
-        if limit:
-            total = min(total, limit)
+        anime_iter = enumerate(islice(anime_list, limit or None), 1)
         
         completed_count = len(self.completed)
-        logger.info(f"Starting scrape of {total} anime ({completed_count} already completed)")
+        logger.info(f"Starting scrape ({completed_count} already completed)")
+        logger.info(f"Concurrency: {self.concurrency}")
         
         scraped = 0
-        for i, anime in enumerate(anime_list[:limit] if limit else anime_list, 1):
-            # Skip if already completed and resume is enabled
-            if resume and anime['url'] in self.completed:
-                continue
-            
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Processing {i}/{total}: {anime['title']}")
-            logger.info(f"{'='*60}")
-            
-            try:
-                # Scrape anime
-                anime_data = self.scrape_anime(anime)
+        
+        async def worker():
+            nonlocal scraped
+            for i, anime in anime_iter:
+                # Skip if already completed and resume is enabled
+                if resume and anime['url'] in self.completed:
+                    continue
                 
-                if anime_data:
-                    # Save data
-                    self.save_anime_data(anime_data)
-                    
-                    # Mark as completed
-                    self.save_progress(anime['url'])
-                    scraped += 1
-                    
-                    logger.info(f"✓ Successfully scraped: {anime['title']} ({anime_data['episode_count']} episodes)")
-                else:
-                    logger.warning(f"✗ Failed to scrape: {anime['title']}")
+                logger.info(f"Processing #{i}: {anime['title']}")
                 
-            except Exception as e:
-                logger.error(f"Error processing {anime['title']}: {e}", exc_info=True)
-            
-            # Rate limiting
-            if i < total:
-                time.sleep(self.delay)
+                try:
+                    # Scrape anime
+                    anime_data = await self.scrape_anime(anime)
+                    
+                    if anime_data:
+                        # Serialize and queue off the event loop (queue.put may block)
+                        loop = asyncio.get_running_loop()
+                        await loop.run_in_executor(None, self.save_anime_data, anime_data, anime.get('_slug'))
+                        
+                        # Mark as completed
+                        await loop.run_in_executor(None, self.save_progress, anime['url'])
+                        scraped += 1
+                        
+                        logger.info(f"✓ Successfully scraped: {anime['title']} ({anime_data['episode_count']} episodes)")
+                    else:
+                        logger.warning(f"✗ Failed to scrape: {anime['title']}")
+                except Exception as e:
+                    logger.error(f"Error processing {anime['title']}: {e}", exc_info=True)
+        
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
         
         logger.info(f"\n{'='*60}")
         logger.info(f"Scraping complete!")
@@ -387,27 +606,82 @@ class AnimeEpisodeScraper:
         logger.info(f"Total completed (including previous): {len(self.completed)}")
         logger.info(f"Output directory: {self.output_dir}")
         logger.info(f"{'='*60}")
+    
+    def create_session(self) -> aiohttp.ClientSession:
+        """
+        Create the HTTP session shared by all workers.
+        
+        Every worker gets its own persistent connection to the site, and idle
+        connections outlive the --delay pause so each page reuses an open
+        TCP/TLS connection instead of handshaking again. Host lookups are
+        cached for the whole crawl and resolved without blocking the loop.
+        """
+        connector = aiohttp.TCPConnector(
+            limit=max(64, self.concurrency),
+            limit_per_host=self.concurrency,
+            keepalive_timeout=max(60, self.delay * 4),
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            # Without aiodns aiohttp falls back to getaddrinfo in a thread pool
+            resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    
+    async def run(self, anime_list: Iterable[Dict[str, str]], limit: Optional[int] = None, resume: bool = True):
+        """
+        Open the HTTP session and scrape all anime from the list.
+        
+        Args:
+            anime_list: Iterable of anime dictionaries
+            limit: Maximum number to scrape (None for all)
+            resume: Whether to resume from previous run
+        """
+        async with self.create_session() as session:
+            self.session = session
+            try:
+                await self.scrape_all(anime_list, limit=limit, resume=resume)
+            finally:
+                self.session = None
+                self.flush()
+
+
+def load_anime_list(filepath: str) -> Iterator[Dict[str, str]]:
+    """
+    Stream anime entries from a JSON or TOON file.
+    
+    JSON arrays are parsed incrementally with ijson when it is installed;
+    TOON has no streaming decoder and is loaded eagerly. Each entry gets a
+    ``_slug`` with its output file stem, computed once here while streaming.
+    """
+    for anime in _read_anime_list(filepath):
+        if isinstance(anime, dict) and isinstance(anime.get('title'), str) and isinstance(anime.get('url'), str):
+            anime['_slug'] = _anime_slug(anime['title'], anime['url'])
+        yield anime
 
 
-def load_anime_list(filepath: str) -> List[Dict[str, str]]:
-    """Load anime list from JSON or TOON file"""
+def _read_anime_list(filepath: str) -> Iterator[Dict[str, str]]:
+    """Yield the raw anime entries of a JSON or TOON file"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Try to detect format based on extension or content
         if filepath.endswith('.toon'):
             if not TOON_AVAILABLE:
                 logger.error("python-toon not installed. Run: pip install python-toon")
-                return []
-            data = toon.decode(content)
+                return
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = toon.decode(f.read())
             # Handle wrapped format
-            return data.get('anime_list', data) if isinstance(data, dict) else data
+            yield from (data.get('anime_list', data) if isinstance(data, dict) else data)
         else:
-            return json.loads(content)
+            with open(filepath, 'rb') as f:
+                if IJSON_AVAILABLE:
+                    yield from ijson.items(f, 'item', use_float=True)
+                else:
+                    yield from json_loads(f.read())
     except Exception as e:
         logger.error(f"Error loading anime list: {e}")
-        return []
 
 
 def parse_args():
@@ -428,13 +702,24 @@ def parse_args():
     parser.add_argument(
         '--limit',
         type=int,
-        help='Limit number of anime to scrape'
+        help='Limit number of anime to scrape (0 for no limit)'
     )
     parser.add_argument(
         '--delay',
         type=float,
         default=1.5,
-        help='Delay between requests in seconds (default: 1.5)'
+        help='Minimum delay between requests to the same host in seconds (default: 1.5)'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=10,
+        help='Number of anime pages fetched concurrently (default: 10)'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Ignore cached HTML in <output>/html and re-download every page'
     )
     parser.add_argument(
         '--resume',
@@ -455,7 +740,10 @@ def parse_args():
     )
     parser.set_defaults(resume=True)
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.limit is not None and args.limit < 0:
+        parser.error('--limit must be 0 (no limit) or a positive number')
+    return args
 
 
 def main():
@@ -466,27 +754,29 @@ def main():
     logger.info(f"Input file: {args.input}")
     logger.info(f"Output directory: {args.output}")
     
-    # Load anime list
+    # Stream anime list (peek one entry to fail fast on empty input)
     anime_list = load_anime_list(args.input)
-    if not anime_list:
+    first = next(anime_list, None)
+    if first is None:
         logger.error("No anime found in input file!")
         return
-    
-    logger.info(f"Loaded {len(anime_list)} anime from list")
+    anime_list = chain([first], anime_list)
     
     # Initialize scraper
     scraper = AnimeEpisodeScraper(
         output_dir=args.output,
         delay=args.delay,
-        output_format=args.format
+        output_format=args.format,
+        concurrency=args.concurrency,
+        refresh=args.refresh
     )
     
     # Start scraping
-    scraper.scrape_all(
+    asyncio.run(scraper.run(
         anime_list=anime_list,
         limit=args.limit,
         resume=args.resume
-    )
+    ))
 
 
 if __name__ == "__main__":
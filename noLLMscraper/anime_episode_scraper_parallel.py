@@ -2,7 +2,7 @@
 """
 Parallel Anime Episode Scraper
 
-Fast parallel version using threading to scrape multiple anime simultaneously.
+Fast parallel version using asyncio to scrape multiple anime simultaneously.
 MUCH faster than sequential version (5-10x speedup).
 
 Usage:
@@ -10,21 +10,27 @@ Usage:
     python anime_episode_scraper_parallel.py --input zoroto_complete.json --workers 10 --limit 100
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
+import asyncio
+import atexit
+import aiohttp
+from lxml import etree
 import time
 import argparse
 import logging
 import os
 import re
-from typing import List, Dict, Optional
+import signal
+import sys
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
 import hashlib
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import threading
 
+from data_io import json_dumps, load_url_progress, open_log, read_json_or_toon
+from html_utils import has_class, make_url_joiner, own_string, parse_page, visible_text
+
 try:
     import toon
     TOON_AVAILABLE = True
@@ -42,6 +48,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used on every scraped page
+_EP_HREF_RE = re.compile(r'episode|ep-?\d+', re.IGNORECASE)
+_EP_NUM_RE = re.compile(r'ep(?:isode)?-?(\d+)', re.IGNORECASE)
+_STATUS_RE = re.compile(r'Status', re.IGNORECASE)
+_UNSAFE_FN_RE = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE_RE = re.compile(r'\s+')
+# Transient responses retried with backoff (connection errors are retried too)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.2
+# Progress lines are written once this many are queued or this long has passed
+_PROGRESS_BATCH = 64
+_PROGRESS_FLUSH_SECS = 5.0
+
+
+# Pages are queried with compiled XPath, so node selection runs in C and only
+# matched elements become Python objects
+_EPLISTER_LINKS_XPATH = etree.XPath(f"(//div[{has_class('eplister')}])[1]//a")
+_EP_UL_LINKS_XPATH = etree.XPath(
+    "//ul[contains(@class, 'episode') or contains(@class, 'eps')]//a[@href]"
+)
+_DATA_LINKS_XPATH = etree.XPath("//a[@data-episode]")
+# Both _EP_HREF_RE alternatives contain 'ep'; the regex is applied to these candidates
+_EP_HREF_CANDIDATES_XPATH = etree.XPath("//a[contains(translate(@href, 'EP', 'ep'), 'ep')]")
+_EPL_NUM_XPATH = etree.XPath(f"(.//div[{has_class('epl-num')}])[1]")
+_EPL_TITLE_XPATH = etree.XPath(f"(.//div[{has_class('epl-title')}])[1]")
+_NUMSCORE_XPATH = etree.XPath(f"(.//div[{has_class('numscore')}])[1]")
+# Every node extract_anime_metadata looks at, in document order, in one query
+_METADATA_XPATH = etree.XPath(
+    "//h1 | //div[@class or @itemprop = 'description'] | //a[contains(@href, '/genre/')] | //span"
+)
+
+
+# Module-level so lru_cache does not hold a reference to the scraper
+@lru_cache(maxsize=16384)
+def _sanitize_filename(title: str) -> str:
+    """Create a safe filename from anime title"""
+    safe = _UNSAFE_FN_RE.sub('', title)
+    safe = _WHITESPACE_RE.sub('_', safe.strip())
+    return safe[:200] or "unnamed"
+
+
+@lru_cache(maxsize=16384)
+def _url_hash(url: str) -> str:
+    """Get short hash of URL for unique identification"""
+    # Same 4-byte BLAKE2b digest as anime_episode_scraper.py, so both name files alike
+    return hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
+
 
 class ParallelAnimeEpisodeScraper:
     """Fast parallel scraper for extracting episode URLs from anime pages"""
@@ -53,7 +107,7 @@ class ParallelAnimeEpisodeScraper:
         
         Args:
             output_dir: Directory to save anime data
-            workers: Number of parallel workers (threads)
+            workers: Number of anime scraped concurrently
             delay: Delay between requests per worker in seconds
             output_format: Output format - 'json' or 'toon'
         """
@@ -67,10 +121,22 @@ class ParallelAnimeEpisodeScraper:
         self.episodes_dir = self.output_dir / "episodes"
         self.episodes_dir.mkdir(exist_ok=True)
         
-        # Progress tracking with thread safety
-        self.progress_file = self.output_dir / "progress.json"
+        # Progress tracking (append-only JSONL log shared with anime_episode_scraper.py,
+        # one {"u": url} record per line)
+        self.progress_file = self.output_dir / "progress.jsonl"
+        self.legacy_progress_file = self.output_dir / "progress.json"
         self.completed = self.load_progress()
-        self.lock = threading.Lock()
+        # Reentrant so a shutdown flush cannot deadlock against an interrupted one
+        self.lock = threading.RLock()
+        # Pages are parsed and mined by extract_page() on this pool, not on the event loop
+        self._parse_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='anime-parse')
+        # Unbuffered: each batch of records is a single O_APPEND write
+        self._progress_fp = open_log(self.progress_file, buffering=0)
+        # Records wait here until _PROGRESS_BATCH of them or _PROGRESS_FLUSH_SECS
+        # have accumulated; at most that much progress is lost on a hard kill
+        self._pending: List[bytes] = []
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush_progress)
         
         # Statistics
         self.stats = {
@@ -78,183 +144,209 @@ class ParallelAnimeEpisodeScraper:
             'total_episodes': 0,
             'failed_anime': 0
         }
-        self.stats_lock = threading.Lock()
     
-    def create_session(self):
-        """Create a new session for thread safety"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        })
-        return session
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session shared by all workers (one connection per worker)"""
+        connector = aiohttp.TCPConnector(limit=self.workers, limit_per_host=self.workers)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+            },
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
     
     def load_progress(self) -> set:
         """Load previously completed anime URLs"""
-        if self.progress_file.exists():
-            try:
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return set(data.get('completed', []))
-            except Exception as e:
-                logger.warning(f"Could not load progress file: {e}")
-        return set()
+        return load_url_progress(self.progress_file, self.legacy_progress_file)
     
     def save_progress(self, url: str):
-        """Save progress (thread-safe)"""
+        """Save progress (thread-safe, queues one log line and writes in batches)"""
+        line = json_dumps({'u': url}) + b'\n'
         with self.lock:
             self.completed.add(url)
+            self._pending.append(line)
+            if (len(self._pending) >= _PROGRESS_BATCH
+                    or time.monotonic() - self._last_flush >= _PROGRESS_FLUSH_SECS):
+                self.flush_progress()
+    
+    def flush_progress(self):
+        """Append all queued progress lines to the log (thread-safe)"""
+        with self.lock:
+            if not self._pending:
+                return
             try:
-                with open(self.progress_file, 'w', encoding='utf-8') as f:
-                    json.dump({'completed': list(self.completed)}, f, indent=2)
+                self._progress_fp.write(b''.join(self._pending))
             except Exception as e:
                 logger.error(f"Could not save progress: {e}")
+            self._pending.clear()
+            self._last_flush = time.monotonic()
     
     def sanitize_filename(self, title: str) -> str:
         """Create a safe filename from anime title"""
-        safe = re.sub(r'[<>:"/\\|?*]', '', title)
-        safe = re.sub(r'\s+', '_', safe.strip())
-        if len(safe) > 200:
-            safe = safe[:200]
-        return safe or "unnamed"
+        return _sanitize_filename(title)
     
     def get_url_hash(self, url: str) -> str:
         """Get short hash of URL for unique identification"""
-        return hashlib.md5(url.encode()).hexdigest()[:8]
+        return _url_hash(url)
     
-    def fetch_anime_page(self, url: str, session: requests.Session) -> Optional[BeautifulSoup]:
-        """Fetch an anime page"""
-        try:
-            response = session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
-        except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {e}")
-            return None
+    async def fetch_anime_page(self, url: str, session: aiohttp.ClientSession) -> Optional[Tuple[bytes, str]]:
+        """Fetch an anime page, retrying connection errors and 429/5xx responses"""
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                async with session.get(url) as response:
+                    if response.status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                        response.raise_for_status()
+                        # The site is utf-8 when no charset header is sent
+                        return await response.read(), response.charset or 'utf-8'
+            except aiohttp.ClientResponseError as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == _MAX_RETRIES:
+                    logger.error(f"Error fetching {url}: {e or type(e).__name__}")
+                    return None
+            await asyncio.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+    
+    def extract_page(self, content: bytes, encoding: str, url: str) -> Tuple[Dict[str, any], List[Dict[str, str]]]:
+        """Parse a fetched page and extract its metadata and episodes (runs in the parse pool)"""
+        # lxml decodes the raw bytes in C; an explicit encoding skips charset sniffing
+        tree = parse_page(content, encoding)
+        return self.extract_anime_metadata(tree), self.extract_episodes(tree, url)
     
-    def extract_episodes(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
+    def extract_episodes(self, tree: etree._Element, base_url: str) -> List[Dict[str, str]]:
         """Extract episode information from anime page"""
         episodes = []
+        join = make_url_joiner(base_url)
         
         # Pattern 1: Episode list in <div class="eplister">
-        eplister = soup.find('div', class_='eplister')
-        if eplister:
-            episode_links = eplister.find_all('a')
-            for link in episode_links:
-                href = link.get('href')
-                if href:
-                    ep_num_div = link.find('div', class_='epl-num')
-                    ep_num = ep_num_div.get_text(strip=True) if ep_num_div else None
-                    ep_title_div = link.find('div', class_='epl-title')
-                    ep_title = ep_title_div.get_text(strip=True) if ep_title_div else None
-                    
-                    episodes.append({
-                        'episode_number': ep_num or f"Episode {len(episodes) + 1}",
-                        'episode_title': ep_title,
-                        'url': urljoin(base_url, href)
-                    })
+        for link in _EPLISTER_LINKS_XPATH(tree):
+            href = link.get('href')
+            if href:
+                ep_num_div = _EPL_NUM_XPATH(link)
+                ep_num = visible_text(ep_num_div[0]) if ep_num_div else None
+                ep_title_div = _EPL_TITLE_XPATH(link)
+                ep_title = visible_text(ep_title_div[0]) if ep_title_div else None
+                
+                episodes.append({
+                    'episode_number': ep_num or f"Episode {len(episodes) + 1}",
+                    'episode_title': ep_title,
+                    'url': join(href)
+                })
         
         # Pattern 2: Episode list in <ul> with episode links
         if not episodes:
-            episode_lists = soup.find_all('ul', class_=re.compile(r'episode|eps'))
-            for ul in episode_lists:
-                links = ul.find_all('a', href=True)
-                for link in links:
-                    href = link.get('href')
-                    text = link.get_text(strip=True)
-                    if href and ('episode' in href.lower() or 'ep' in href.lower()):
-                        episodes.append({
-                            'episode_number': text or f"Episode {len(episodes) + 1}",
-                            'episode_title': None,
-                            'url': urljoin(base_url, href)
-                        })
+            for link in _EP_UL_LINKS_XPATH(tree):
+                href = link.get('href')
+                text = visible_text(link)
+                if href and ('episode' in href.lower() or 'ep' in href.lower()):
+                    episodes.append({
+                        'episode_number': text or f"Episode {len(episodes) + 1}",
+                        'episode_title': None,
+                        'url': join(href)
+                    })
         
         # Pattern 3: Episode links with data attributes
         if not episodes:
-            ep_links = soup.find_all('a', {'data-episode': True})
-            for link in ep_links:
+            for link in _DATA_LINKS_XPATH(tree):
                 href = link.get('href')
                 ep_num = link.get('data-episode')
                 if href:
                     episodes.append({
                         'episode_number': ep_num or f"Episode {len(episodes) + 1}",
-                        'episode_title': link.get_text(strip=True),
-                        'url': urljoin(base_url, href)
+                        'episode_title': visible_text(link),
+                        'url': join(href)
                     })
         
         # Pattern 4: Direct episode links in the page
         if not episodes:
-            all_links = soup.find_all('a', href=re.compile(r'episode|ep-?\d+', re.IGNORECASE))
-            for link in all_links:
+            for link in _EP_HREF_CANDIDATES_XPATH(tree):
                 href = link.get('href')
-                if href:
-                    ep_match = re.search(r'ep(?:isode)?-?(\d+)', href, re.IGNORECASE)
+                if _EP_HREF_RE.search(href):
+                    ep_match = _EP_NUM_RE.search(href)
                     ep_num = ep_match.group(1) if ep_match else None
                     episodes.append({
-                        'episode_number': f"Episode {ep_num}" if ep_num else link.get_text(strip=True),
+                        'episode_number': f"Episode {ep_num}" if ep_num else visible_text(link),
                         'episode_title': None,
-                        'url': urljoin(base_url, href)
+                        'url': join(href)
                     })
         
         return episodes
     
-    def extract_anime_metadata(self, soup: BeautifulSoup) -> Dict[str, any]:
+    def extract_anime_metadata(self, tree: etree._Element) -> Dict[str, any]:
         """Extract metadata from anime page"""
+        h1_title = h1_any = div_content = div_desc = status_elem = rating_elem = None
+        genres = []
+        
+        # One XPath query returns every candidate node; dispatch on the tag
+        for node in _METADATA_XPATH(tree):
+            tag = node.tag
+            if tag == 'a':
+                genres.append(visible_text(node))
+            elif tag == 'div':
+                classes = (node.get('class') or '').split()
+                if div_content is None and 'entry-content' in classes:
+                    div_content = node
+                elif rating_elem is None and 'rating' in classes:
+                    rating_elem = node
+                if div_desc is None and node.get('itemprop') == 'description':
+                    div_desc = node
+            elif tag == 'span':
+                if status_elem is None:
+                    string = own_string(node)
+                    if string and _STATUS_RE.search(string):
+                        status_elem = node
+            elif tag == 'h1':
+                if h1_any is None:
+                    h1_any = node
+                if h1_title is None and 'entry-title' in (node.get('class') or '').split():
+                    h1_title = node
+        
         metadata = {}
         
-        title_elem = soup.find('h1', class_='entry-title')
-        if not title_elem:
-            title_elem = soup.find('h1')
-        metadata['title'] = title_elem.get_text(strip=True) if title_elem else None
+        title_elem = h1_title if h1_title is not None else h1_any
+        metadata['title'] = visible_text(title_elem) if title_elem is not None else None
         
-        desc_elem = soup.find('div', class_='entry-content')
-        if not desc_elem:
-            desc_elem = soup.find('div', itemprop='description')
-        metadata['description'] = desc_elem.get_text(strip=True) if desc_elem else None
+        desc_elem = div_content if div_content is not None else div_desc
+        metadata['description'] = visible_text(desc_elem) if desc_elem is not None else None
         
-        genres = []
-        genre_links = soup.find_all('a', href=re.compile(r'/genre/'))
-        for link in genre_links:
-            genres.append(link.get_text(strip=True))
         metadata['genres'] = genres
         
-        status_elem = soup.find('span', string=re.compile(r'Status', re.IGNORECASE))
-        if status_elem:
-            status_parent = status_elem.find_parent()
-            if status_parent:
-                metadata['status'] = status_parent.get_text(strip=True).replace('Status:', '').strip()
+        if status_elem is not None:
+            status_parent = status_elem.getparent()
+            if status_parent is not None:
+                metadata['status'] = visible_text(status_parent).replace('Status:', '').strip()
         
-        rating_elem = soup.find('div', class_='rating')
-        if rating_elem:
-            score = rating_elem.find('div', class_='numscore')
-            metadata['rating'] = score.get_text(strip=True) if score else None
+        if rating_elem is not None:
+            score = _NUMSCORE_XPATH(rating_elem)
+            metadata['rating'] = visible_text(score[0]) if score else None
         
         return metadata
     
-    def scrape_single_anime(self, anime: Dict[str, str], session: requests.Session) -> Optional[Dict[str, any]]:
-        """Scrape a single anime page (thread-safe)"""
+    async def scrape_single_anime(self, anime: Dict[str, str], session: aiohttp.ClientSession) -> Optional[Dict[str, any]]:
+        """Scrape a single anime page"""
         url = anime['url']
         title = anime['title']
         
         # Fetch page
-        soup = self.fetch_anime_page(url, session)
-        if not soup:
-            with self.stats_lock:
-                self.stats['failed_anime'] += 1
+        page = await self.fetch_anime_page(url, session)
+        if page is None:
+            self.stats['failed_anime'] += 1
             return None
         
         # Extract data
-        metadata = self.extract_anime_metadata(soup)
-        episodes = self.extract_episodes(soup, url)
+        metadata, episodes = await asyncio.get_running_loop().run_in_executor(
+            self._parse_pool, self.extract_page, *page, url
+        )
         
-        # Update stats
-        with self.stats_lock:
-            self.stats['total_anime'] += 1
-            self.stats['total_episodes'] += len(episodes)
+        # Update stats (only ever touched from the event loop)
+        self.stats['total_anime'] += 1
+        self.stats['total_episodes'] += len(episodes)
         
         # Rate limiting per worker
-        time.sleep(self.delay)
+        await asyncio.sleep(self.delay)
         
         return {
             'title': title,
@@ -266,7 +358,7 @@ class ParallelAnimeEpisodeScraper:
         }
     
     def save_anime_data(self, anime_data: Dict[str, any]):
-        """Save anime data to file (thread-safe)"""
+        """Save anime data to file (thread-safe, atomic per file)"""
         title = anime_data['title']
         url = anime_data['url']
         url_hash = self.get_url_hash(url)
@@ -276,21 +368,39 @@ class ParallelAnimeEpisodeScraper:
         ext = '.toon' if self.output_format == 'toon' else '.json'
         episodes_file = self.episodes_dir / f"{filename}{ext}"
         
+        # Every anime has its own file, so no lock is needed; writing a temp file
+        # and renaming it means a crash never leaves a truncated episodes file
+        tmp_file = episodes_file.with_name(episodes_file.name + '.tmp')
         try:
-            with self.lock:
-                if self.output_format == 'toon' and TOON_AVAILABLE:
-                    toon_str = toon.encode(anime_data)
-                    with open(episodes_file, 'w', encoding='utf-8') as f:
-                        f.write(toon_str)
-                else:
-                    with open(episodes_file, 'w', encoding='utf-8') as f:
-                        json.dump(anime_data, f, ensure_ascii=False, indent=2)
+            if self.output_format == 'toon' and TOON_AVAILABLE:
+                toon_str = toon.encode(anime_data)
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    f.write(toon_str)
+            else:
+                with open(tmp_file, 'wb') as f:
+                    f.write(json_dumps(anime_data, indent=True))
+            os.replace(tmp_file, episodes_file)
         except Exception as e:
             logger.error(f"Error saving anime data: {e}")
     
     def scrape_all(self, anime_list: List[Dict[str, str]], limit: Optional[int] = None, resume: bool = True):
         """
-        Scrape all anime in parallel.
+        Scrape all anime in parallel (runs the event loop until done).
+        
+        Args:
+            anime_list: List of anime dictionaries
+            limit: Maximum number of anime to process
+            resume: Whether to resume from previous run
+        """
+        try:
+            asyncio.run(self.scrape_all_async(anime_list, limit=limit, resume=resume))
+        finally:
+            self._parse_pool.shutdown()
+            self.flush_progress()
+    
+    async def scrape_all_async(self, anime_list: List[Dict[str, str]], limit: Optional[int] = None, resume: bool = True):
+        """
+        Scrape all anime concurrently, at most ``workers`` at a time.
         
         Args:
             anime_list: List of anime dictionaries
@@ -315,34 +425,30 @@ class ParallelAnimeEpisodeScraper:
         start_time = time.time()
         scraped = 0
         
-        # Process anime in parallel
-        with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            # Create a session per thread
-            sessions = {}
-            
-            def get_session():
-                thread_id = threading.get_ident()
-                if thread_id not in sessions:
-                    sessions[thread_id] = self.create_session()
-                return sessions[thread_id]
-            
-            # Submit all anime
-            future_to_anime = {
-                executor.submit(self.scrape_single_anime, anime, get_session()): anime
-                for anime in anime_to_scrape
-            }
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(self.workers)
+        
+        async with self.create_session() as session:
+            async def worker(anime):
+                async with sem:
+                    try:
+                        return anime, await self.scrape_single_anime(anime, session), None
+                    except Exception as e:
+                        return anime, None, e
             
             # Collect results as they complete
-            for i, future in enumerate(as_completed(future_to_anime), 1):
-                anime = future_to_anime[future]
+            tasks = [asyncio.ensure_future(worker(anime)) for anime in anime_to_scrape]
+            for i, task in enumerate(asyncio.as_completed(tasks), 1):
+                anime, result, error = await task
                 try:
-                    result = future.result()
+                    if error:
+                        raise error
                     if result:
-                        # Save data
-                        self.save_anime_data(result)
+                        # Save data (file I/O stays off the event loop)
+                        await loop.run_in_executor(None, self.save_anime_data, result)
                         
                         # Mark as completed
-                        self.save_progress(anime['url'])
+                        await loop.run_in_executor(None, self.save_progress, anime['url'])
                         scraped += 1
                         
                         logger.info(f"[{i}/{total}] ✓ {anime['title']} ({result['episode_count']} episodes)")
@@ -375,17 +481,10 @@ class ParallelAnimeEpisodeScraper:
 def load_anime_list(filepath: str) -> List[Dict[str, str]]:
     """Load anime list from JSON or TOON file"""
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        if filepath.endswith('.toon'):
-            if not TOON_AVAILABLE:
-                logger.error("python-toon not installed. Run: pip install python-toon")
-                return []
-            data = toon.decode(content)
-            return data.get('anime_list', data) if isinstance(data, dict) else data
-        else:
-            return json.loads(content)
+        data = read_json_or_toon(filepath)
+        if filepath.endswith('.toon') and isinstance(data, dict):
+            return data.get('anime_list', data)
+        return data
     except Exception as e:
         logger.error(f"Error loading anime list: {e}")
         return []
@@ -472,6 +571,10 @@ def main():
         output_format=args.format
     )
     
+    # Exit normally on SIGTERM so queued progress is flushed, as it already
+    # is on Ctrl+C (KeyboardInterrupt)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    
     # Start scraping
     scraper.scrape_all(
         anime_list=anime_list,
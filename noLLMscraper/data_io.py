@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Shared JSON/TOON file I/O
+
+Used by the pipeline scripts for JSON encoding/decoding, whole JSON or TOON
+documents and their append-only JSONL logs, so they all go through the same
+orjson-backed fast path.
+"""
+
+import json
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import toon
+    TOON_AVAILABLE = True
+except ImportError:
+    TOON_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# URL of one progress.jsonl record; a torn last line never matches
+_PROGRESS_URL_RE = re.compile(r'"u":"([^"\\\n]*(?:\\.[^"\\\n]*)*)"')
+
+
+def json_dumps(data, indent: bool = False) -> bytes:
+    """Encode data as UTF-8 JSON bytes (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+def open_log(path: Union[str, Path], buffering: int = -1):
+    """Open an append-only JSONL log, starting on a fresh line if a crash tore the last one"""
+    fp = open(path, 'ab', buffering=buffering)
+    if fp.tell():
+        with open(path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b'\n':
+                fp.write(b'\n')
+    return fp
+
+
+def load_url_progress(path: Union[str, Path], legacy_path: Union[str, Path]) -> set:
+    """
+    Load the URLs recorded in a {"u": url} JSONL progress log.
+
+    Args:
+        path: Append-only progress log (progress.jsonl)
+        legacy_path: Older runs' single {"completed": [...]} document
+
+    Returns:
+        Set of completed URLs (empty when neither file can be read)
+    """
+    completed = set()
+
+    if os.path.exists(legacy_path):
+        try:
+            with open(legacy_path, 'rb') as f:
+                completed.update(json_loads(f.read()).get('completed', []))
+        except Exception as e:
+            logger.warning(f"Could not load legacy progress file: {e}")
+
+    if os.path.exists(path):
+        try:
+            with open(path, 'rb') as f:
+                # A torn last line may end mid-character; it never matches anyway
+                text = f.read().decode('utf-8', errors='replace')
+            # One regex sweep instead of a JSON parse per line; only URLs
+            # with escaped characters go through the JSON decoder
+            completed.update(
+                json_loads(f'"{raw}"') if '\\' in raw else raw
+                for raw in _PROGRESS_URL_RE.findall(text)
+            )
+        except Exception as e:
+            logger.warning(f"Could not load progress file: {e}")
+    return completed
+
+
+def read_json_or_toon(path: Union[str, Path]) -> Any:
+    """
+    Read and decode a JSON or TOON file (TOON when the name ends in .toon).
+
+    Args:
+        path: File to read
+
+    Returns:
+        Decoded data
+
+    Raises:
+        ImportError: If the file is TOON and python-toon is not installed
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON/TOON
+    """
+    if os.fspath(path).endswith('.toon') and not TOON_AVAILABLE:
+        raise ImportError("python-toon not installed. Run: pip install python-toon")
+
+    with open(path, 'rb') as f:
+        content = f.read()
+
+    if os.fspath(path).endswith('.toon'):
+        return toon.decode(content.decode('utf-8'))
+    return json_loads(content)
@@ -10,12 +10,15 @@ Usage:
     python data_organizer.py --output-dir website_data --format combined
 """
 
-import json
 import argparse
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from data_io import json_dumps, read_json_or_toon
 
 try:
     import toon
@@ -36,7 +39,8 @@ class AnimeDataOrganizer:
     
     def __init__(self, video_data_dir: str = "video_data/videos", 
                  output_dir: str = "website_data",
-                 output_format: str = "json"):
+                 output_format: str = "json",
+                 workers: Optional[int] = None):
         """
         Initialize the organizer.
         
@@ -44,10 +48,12 @@ class AnimeDataOrganizer:
             video_data_dir: Directory with video JSON/TOON files
             output_dir: Directory for organized output
             output_format: Output format - 'json' or 'toon'
+            workers: Number of worker processes (default: CPU count)
         """
         self.video_data_dir = Path(video_data_dir)
         self.output_dir = Path(output_dir)
         self.output_format = output_format
+        self.workers = workers or os.cpu_count() or 1
         
         # Create output directory
         self.output_dir.mkdir(exist_ok=True)
@@ -55,16 +61,7 @@ class AnimeDataOrganizer:
     def load_video_data(self, video_file: Path) -> Optional[Dict]:
         """Load a single video data file (JSON or TOON)"""
         try:
-            with open(video_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            if video_file.suffix == '.toon':
-            if not TOON_AVAILABLE:
-                logger.error("python-toon not installed. Run: pip install python-toon")
-                return None
-            return toon.decode(content)
-            else:
-                return json.loads(content)
+            return read_json_or_toon(video_file)
         except Exception as e:
             logger.error(f"Error loading {video_file}: {e}")
             return None
@@ -77,8 +74,8 @@ class AnimeDataOrganizer:
                 with open(filepath, 'w', encoding='utf-8') as f:
                     f.write(toon_str)
             else:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                with open(filepath, 'wb') as f:
+                    f.write(json_dumps(data, indent=True))
         except Exception as e:
             logger.error(f"Error saving {filepath}: {e}")
     
@@ -95,77 +92,143 @@ class AnimeDataOrganizer:
         anime_title = video_data.get('anime_title', 'Unknown')
         episodes = video_data.get('episodes', [])
         
-        # Organize episodes
+        # Organize episodes (one dict per episode; available ones are counted on the way)
         organized_episodes = []
+        available = 0
         for ep in episodes:
-            episode_data = {
+            sources = ep.get('iframe_urls', [])
+            has_videos = len(sources) > 0
+            available += has_videos
+            organized_episodes.append({
                 'episode_number': ep.get('episode_number'),
                 'episode_url': ep.get('episode_url'),
-                'video_sources': ep.get('iframe_urls', []),
-                'has_videos': len(ep.get('iframe_urls', [])) > 0
-            }
-            organized_episodes.append(episode_data)
+                'video_sources': sources,
+                'has_videos': has_videos
+            })
         
         # Create organized structure
         organized = {
             'title': anime_title,
             'total_episodes': len(episodes),
-            'available_episodes': len([e for e in organized_episodes if e['has_videos']]),
+            'available_episodes': available,
             'episodes': organized_episodes
         }
         
         return organized
     
-    def create_anime_index(self, all_anime: List[Dict]) -> Dict:
+    def build_all_views(self, all_anime: Iterable[Dict]) -> Tuple[Dict, List[Dict], Dict]:
         """
-        Create searchable index of all anime.
+        Build the index, search data and statistics in one pass over all anime.
+        
+        Only the small per-anime index/search entries are kept, so all_anime
+        can be a stream that is never held in memory as a whole.
         
         Args:
-            all_anime: List of all anime data
+            all_anime: Iterable of all anime data
             
         Returns:
-            Index dictionary
+            Tuple of (index dictionary, search data list, statistics dictionary)
         """
-        index = {
-            'total_anime': len(all_anime),
-            'total_episodes': sum(a.get('total_episodes', 0) for a in all_anime),
-            'anime_list': []
-        }
+        anime_list = []
+        search_data = []
+        total_anime = 0
+        total_episodes = 0
+        available_episodes = 0
+        total_videos = 0
+        most_episodes = None
         
         for anime in all_anime:
-            index['anime_list'].append({
-                'title': anime.get('title'),
+            title = anime.get('title')
+            episodes_count = anime.get('total_episodes', 0)
+            available_count = anime.get('available_episodes', 0)
+            
+            anime_list.append({
+                'title': title,
                 'total_episodes': anime.get('total_episodes'),
                 'available_episodes': anime.get('available_episodes')
             })
+            search_title = anime.get('title', '')
+            search_data.append({
+                'title': search_title,
+                'title_lower': search_title.lower(),
+                'total_episodes': anime.get('total_episodes'),
+                'available_episodes': anime.get('available_episodes')
+            })
+            
+            total_anime += 1
+            total_episodes += episodes_count
+            available_episodes += available_count
+            for episode in anime.get('episodes', []):
+                total_videos += len(episode.get('video_sources', []))
+            # Strict comparison keeps the first anime on ties, like max()
+            if most_episodes is None or episodes_count > most_episodes.get('total_episodes', 0):
+                most_episodes = anime
         
         # Sort by title
-        index['anime_list'].sort(key=lambda x: x.get('title', '').lower())
+        anime_list.sort(key=lambda x: x.get('title', '').lower())
         
-        return index
+        index = {
+            'total_anime': total_anime,
+            'total_episodes': total_episodes,
+            'anime_list': anime_list
+        }
+        
+        stats = {
+            'total_anime': total_anime,
+            'total_episodes': total_episodes,
+            'available_episodes': available_episodes,
+            'total_video_sources': total_videos,
+            'avg_episodes_per_anime': round(total_episodes / total_anime, 1) if total_anime else 0,
+            'avg_sources_per_episode': round(total_videos / total_episodes, 1) if total_episodes else 0,
+            'anime_with_most_episodes': {
+                'title': most_episodes.get('title'),
+                'episodes': most_episodes.get('total_episodes')
+            } if most_episodes else {}
+        }
+        
+        return index, search_data, stats
     
-    def create_search_data(self, all_anime: List[Dict]) -> List[Dict]:
+    def stream_combined(self, all_anime: Iterable[Dict], filepath: Path) -> Iterator[Dict]:
         """
-        Create search-optimized data.
+        Write {'anime': [...]} to filepath incrementally, passing each anime through.
+        
+        JSON output is written one anime at a time with the same layout as an
+        indented dump of the whole document; TOON has no streaming encoder, so
+        it is collected and saved once the stream ends.
         
         Args:
-            all_anime: List of all anime data
+            all_anime: Iterable of all anime data
+            filepath: Combined output file
             
-        Returns:
-            Search data list
+        Yields:
+            Each anime from all_anime, after it has been written
         """
-        search_data = []
+        if self.output_format == 'toon' and TOON_AVAILABLE:
+            collected = []
+            for anime in all_anime:
+                collected.append(anime)
+                yield anime
+            self.save_data({'anime': collected}, filepath)
+            return
         
-        for anime in all_anime:
-            title = anime.get('title', '')
-            search_data.append({
-                'title': title,
-                'title_lower': title.lower(),
-                'total_episodes': anime.get('total_episodes'),
-                'available_episodes': anime.get('available_episodes')
-            })
+        try:
+            f = open(filepath, 'wb')
+        except OSError as e:
+            logger.error(f"Error saving {filepath}: {e}")
+            yield from all_anime
+            return
         
-        return search_data
+        with f:
+            f.write(b'{\n  "anime": [')
+            separator = b'\n    '
+            count = 0
+            for anime in all_anime:
+                # JSON strings never contain raw newlines, so re-indenting is safe
+                f.write(separator + json_dumps(anime, indent=True).replace(b'\n', b'\n    '))
+                separator = b',\n    '
+                count += 1
+                yield anime
+            f.write(b'\n  ]\n}' if count else b']\n}')
     
     def organize_all(self, format_type: str = "separate"):
         """
@@ -177,8 +240,17 @@ class AnimeDataOrganizer:
         logger.info("Starting data organization...")
         logger.info(f"Output format: {self.output_format}")
         
-        # Get all video files (JSON and TOON)
-        video_files = list(self.video_data_dir.glob('*.json')) + list(self.video_data_dir.glob('*.toon'))
+        # Get all video files (JSON first, then TOON) from a single directory scan;
+        # DirEntry.is_file() answers from the directory listing on most filesystems
+        json_files, toon_files = [], []
+        if self.video_data_dir.is_dir():
+            with os.scandir(self.video_data_dir) as it:
+                for entry in it:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        json_files.append(Path(entry.path))
+                    elif entry.name.endswith('.toon') and entry.is_file():
+                        toon_files.append(Path(entry.path))
+        video_files = json_files + toon_files
         
         if not video_files:
             logger.error(f"No video data files found in {self.video_data_dir}")
@@ -186,58 +258,39 @@ class AnimeDataOrganizer:
         
         logger.info(f"Found {len(video_files)} anime to organize")
         
-        all_anime = []
+        ext = '.toon' if self.output_format == 'toon' else '.json'
         
-        # Process each anime
-        for i, video_file in enumerate(video_files, 1):
-            if i % 100 == 0:
-                logger.info(f"Processing {i}/{len(video_files)}...")
+        # Each file is independent and parse-bound, so load, organize and save
+        # them in worker processes; map() keeps the results in file order
+        process_file = partial(_organize_file, self, format_type in ["separate", "both"])
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            def organized_anime() -> Iterator[Dict]:
+                for i, organized in enumerate(executor.map(process_file, video_files, chunksize=32), 1):
+                    if i % 100 == 0:
+                        logger.info(f"Processing {i}/{len(video_files)}...")
+                    if organized is not None:
+                        yield organized
             
-            video_data = self.load_video_data(video_file)
-            if not video_data:
-                continue
+            # Anime stream through the combined file writer (if requested) into
+            # the index/search/statistics builder, never held in one list
+            all_anime = organized_anime()
+            if format_type in ["combined", "both"]:
+                combined_file = self.output_dir / f"all_anime{ext}"
+                logger.info(f"Streaming combined data to: {combined_file}")
+                all_anime = self.stream_combined(all_anime, combined_file)
             
-            organized = self.organize_anime_data(video_data)
-            all_anime.append(organized)
-            
-            # Save individual anime files if requested
-            if format_type in ["separate", "both"]:
-                # Use correct extension based on output format
-                ext = '.toon' if self.output_format == 'toon' else '.json'
-                base_name = video_file.stem
-                anime_file = self.output_dir / f"{base_name}{ext}"
-                self.save_data(organized, anime_file)
-        
-        logger.info(f"Organized {len(all_anime)} anime")
+            index, search_data, stats = self.build_all_views(all_anime)
         
-        # Create combined file if requested
-        if format_type in ["combined", "both"]:
-            logger.info("Creating combined data file...")
-            ext = '.toon' if self.output_format == 'toon' else '.json'
-            combined_file = self.output_dir / f"all_anime{ext}"
-            self.save_data({'anime': all_anime}, combined_file)
-            logger.info(f"Saved combined data to: {combined_file}")
+        logger.info(f"Organized {stats['total_anime']} anime")
         
-        # Determine file extension
-        ext = '.toon' if self.output_format == 'toon' else '.json'
-        
-        # Create index
-        logger.info("Creating anime index...")
-        index = self.create_anime_index(all_anime)
         index_file = self.output_dir / f"anime_index{ext}"
         self.save_data(index, index_file)
         logger.info(f"Saved index to: {index_file}")
         
-        # Create search data
-        logger.info("Creating search data...")
-        search_data = self.create_search_data(all_anime)
         search_file = self.output_dir / f"search_data{ext}"
         self.save_data({'search': search_data}, search_file)
         logger.info(f"Saved search data to: {search_file}")
         
-        # Create statistics
-        logger.info("Creating statistics...")
-        stats = self.create_statistics(all_anime)
         stats_file = self.output_dir / f"statistics{ext}"
         self.save_data(stats, stats_file)
         logger.info(f"Saved statistics to: {stats_file}")
@@ -245,40 +298,39 @@ class AnimeDataOrganizer:
         # Summary
         logger.info(f"\n{'='*60}")
         logger.info("Data organization complete!")
-        logger.info(f"Total anime: {len(all_anime)}")
+        logger.info(f"Total anime: {stats['total_anime']}")
         logger.info(f"Total episodes: {stats['total_episodes']}")
         logger.info(f"Total video sources: {stats['total_video_sources']}")
         logger.info(f"Output directory: {self.output_dir}")
         logger.info(f"{'='*60}")
+
+
+def _organize_file(organizer: AnimeDataOrganizer, save_separate: bool, video_file: Path) -> Optional[Dict]:
+    """
+    Load and organize one video data file (runs in a worker process).
     
-    def create_statistics(self, all_anime: List[Dict]) -> Dict:
-        """Create statistics about the data"""
-        total_episodes = sum(a.get('total_episodes', 0) for a in all_anime)
-        available_episodes = sum(a.get('available_episodes', 0) for a in all_anime)
-        
-        # Count total video sources
-        total_videos = 0
-        for anime in all_anime:
-            for episode in anime.get('episodes', []):
-                total_videos += len(episode.get('video_sources', []))
-        
-        # Find anime with most episodes
-        most_episodes = max(all_anime, key=lambda x: x.get('total_episodes', 0)) if all_anime else {}
+    Args:
+        organizer: Organizer whose settings to use
+        save_separate: Whether to also save the individual anime file
+        video_file: Video data file to process
         
-        stats = {
-            'total_anime': len(all_anime),
-            'total_episodes': total_episodes,
-            'available_episodes': available_episodes,
-            'total_video_sources': total_videos,
-            'avg_episodes_per_anime': round(total_episodes / len(all_anime), 1) if all_anime else 0,
-            'avg_sources_per_episode': round(total_videos / total_episodes, 1) if total_episodes else 0,
-            'anime_with_most_episodes': {
-                'title': most_episodes.get('title'),
-                'episodes': most_episodes.get('total_episodes')
-            } if most_episodes else {}
-        }
-        
-        return stats
+    Returns:
+        Organized anime data or None if the file could not be loaded
+    """
+    video_data = organizer.load_video_data(video_file)
+    if not video_data:
+        return None
+    
+    organized = organizer.organize_anime_data(video_data)
+    
+    # Save individual anime files if requested
+    if save_separate:
+        # Use correct extension based on output format
+        ext = '.toon' if organizer.output_format == 'toon' else '.json'
+        anime_file = organizer.output_dir / f"{video_file.stem}{ext}"
+        organizer.save_data(organized, anime_file)
+    
+    return organized
 
 
 def parse_args():
@@ -308,6 +360,11 @@ def parse_args():
         default='json',
         help='Data format: json or toon (default: json)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of worker processes for loading files (default: CPU count)'
+    )
     
     return parser.parse_args()
 
@@ -331,7 +388,8 @@ def main():
     organizer = AnimeDataOrganizer(
         video_data_dir=args.input,
         output_dir=args.output,
-        output_format=args.output_format
+        output_format=args.output_format,
+        workers=args.workers
     )
     
     # Organize data
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Shared lxml page parsing and URL joining
+
+Used by the scrapers that parse pages with lxml and query them with compiled
+XPath (anime_episode_scraper.py, anime_episode_scraper_parallel.py,
+video_url_scraper.py, video_url_scraper_parallel.py, zoroto_scraper.py and
+the repo-root unified_scraper_fast.py), so they all parse, read text and
+resolve links the same way.
+"""
+
+import re
+import threading
+from typing import Callable, Optional
+from urllib.parse import urljoin, urlsplit
+
+from lxml import etree
+
+# Pages are parsed by lxml directly, so node selection runs in C and only
+# matched elements become Python objects. lxml releases the GIL while parsing,
+# so callers may parse on worker threads; parsers are not thread-safe, so each
+# thread keeps its own, one per page encoding.
+# No query looks elements up by id, so the parser skips building the id index.
+# The plain etree parser is used rather than lxml.html's: extraction needs no
+# HtmlElement API, and it skips a Python class lookup for every element proxy.
+_parser_local = threading.local()
+
+# Visible text only, like BeautifulSoup's get_text(): no script/style/template/ruby text
+_TEXT_XPATH = etree.XPath(
+    "descendant::text()[not(ancestor::script or ancestor::style or ancestor::template"
+    " or ancestor::rt or ancestor::rp)]"
+)
+
+# Absolute and protocol-relative URLs that urljoin() returns unchanged apart
+# from the scheme: plain host, no params/fragment/whitespace, non-empty query
+_PLAIN_URL_TAIL = r"//[\w.~%!$&'()*+,=:-]+(?:/[^;?#\[\]\s]*)?(?:\?[^#\s]+)?\Z"
+_ABSOLUTE_URL_RE = re.compile(r'https?:' + _PLAIN_URL_TAIL, re.ASCII)
+_PROTOCOL_RELATIVE_URL_RE = re.compile(_PLAIN_URL_TAIL, re.ASCII)
+# Dot segments, query/fragment and tab/newline need urljoin()'s normalization
+_URL_NEEDS_JOIN_RE = re.compile(r'/\.|[?#\t\r\n]')
+
+
+def has_class(name: str) -> str:
+    """XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def parse_page(content: bytes, encoding: str = 'utf-8') -> etree._Element:
+    """Parse page bytes into an lxml tree (an empty page gives an empty <html>)"""
+    parsers = getattr(_parser_local, 'parsers', None)
+    if parsers is None:
+        parsers = _parser_local.parsers = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        try:
+            parser = etree.HTMLParser(encoding=encoding, collect_ids=False)
+        except LookupError:
+            # Charset libxml2 does not know; decode as utf-8 like requests does
+            parser = etree.HTMLParser(encoding='utf-8', collect_ids=False)
+        parsers[encoding] = parser
+    # A page with no elements parses to None
+    root = etree.fromstring(content, parser=parser)
+    return root if root is not None else etree.Element('html')
+
+
+def visible_text(elem: etree._Element) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True)"""
+    return ''.join(t.strip() for t in _TEXT_XPATH(elem))
+
+
+def own_string(elem: etree._Element) -> Optional[str]:
+    """Equivalent of BeautifulSoup's Tag.string: the text of a single-child chain, else None"""
+    while len(elem):
+        if len(elem) > 1 or elem.text or elem[0].tail:
+            return None
+        elem = elem[0]
+    return elem.text
+
+
+def make_url_joiner(base_url: str) -> Callable[[str], str]:
+    """
+    Build a urljoin() equivalent for one page that parses base_url only once.
+
+    Plain absolute, protocol-relative and root-relative links (the usual
+    episode, anime and player URLs) are joined with string operations;
+    anything urljoin() would normalize falls back to it.
+    """
+    parts = urlsplit(base_url)
+    if not (parts.scheme and parts.netloc):
+        return lambda href: urljoin(base_url, href)
+    prefix = f"{parts.scheme}://{parts.netloc}"
+
+    def join(href: str) -> str:
+        if href[:2] == '//':
+            if _PROTOCOL_RELATIVE_URL_RE.match(href):
+                return f"{parts.scheme}:{href}"
+        elif href[:1] == '/':
+            if not _URL_NEEDS_JOIN_RE.search(href):
+                return prefix + href
+        elif _ABSOLUTE_URL_RE.match(href):
+            return href
+        return urljoin(base_url, href)
+
+    return join
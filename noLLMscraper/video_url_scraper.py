@@ -10,18 +10,22 @@ Usage:
     python video_url_scraper.py --input anime_data/episodes --limit 5 --resume
 """
 
+import atexit
+import queue
+import threading
 import requests
-from bs4 import BeautifulSoup
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 import time
 import argparse
 import logging
-import os
 import re
 from typing import List, Dict, Optional
 from pathlib import Path
-from urllib.parse import urljoin, urlparse, parse_qs
-import hashlib
+
+from data_io import json_dumps, json_loads, open_log, read_json_or_toon
+from html_utils import make_url_joiner, parse_page
 
 # Setup logging
 logging.basicConfig(
@@ -35,6 +39,49 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Iframes are found with Element.iter(), which walks the parsed tree in C.
+# Pages without this byte sequence cannot contain an iframe and are not parsed
+_IFRAME_TAG_RE = re.compile(rb'<iframe', re.IGNORECASE)
+# Transient responses retried with backoff (connection errors are retried too)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+
+
+def _parse_player_page(content: bytes, encoding: str) -> etree._Element:
+    """
+    Parse page bytes into an lxml tree for iframe lookup.
+    
+    An empty page, or one with no iframe tag at all, gives an empty <html>.
+    """
+    try:
+        ascii_compatible = '<iframe'.encode(encoding) == b'<iframe'
+    except (LookupError, UnicodeError):
+        ascii_compatible = False
+    # A regex sweep over the raw bytes is far cheaper than building the tree;
+    # charsets like UTF-16 spell the tag differently, so those are always parsed
+    if ascii_compatible and not _IFRAME_TAG_RE.search(content):
+        return etree.Element('html')
+    return parse_page(content, encoding)
+
+
+def _iframe_srcs(tree: etree._Element) -> List[str]:
+    """Get each iframe's URL attribute in page order (lazy-loaded players keep it in data-src)"""
+    srcs = (
+        iframe.get('src') or iframe.get('data-src') or iframe.get('data-lazy-src')
+        for iframe in tree.iter('iframe')
+    )
+    return [src for src in srcs if src]
+
+
+def _page_from_srcs(srcs: List[str]) -> etree._Element:
+    """Rebuild a page holding one iframe per src, for a cached page that is still current"""
+    root = etree.Element('html')
+    for src in srcs:
+        etree.SubElement(root, 'iframe', src=src)
+    return root
+
+
 class VideoUrlScraper:
     """Scraper for extracting video URLs from episode pages"""
     
@@ -49,6 +96,19 @@ class VideoUrlScraper:
         self.output_dir = Path(output_dir)
         self.delay = delay
         self.session = requests.Session()
+        # Pages are fetched one at a time, so a single kept-alive connection per
+        # host is all the pool needs; the adapter also retries transient failures
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=1,
+            max_retries=Retry(
+                total=_MAX_RETRIES,
+                backoff_factor=_BACKOFF_FACTOR,
+                status_forcelist=_RETRY_STATUSES
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Referer': 'https://zoroto.com.in/'
@@ -59,69 +119,173 @@ class VideoUrlScraper:
         self.videos_dir = self.output_dir / "videos"
         self.videos_dir.mkdir(exist_ok=True)
         
-        # Progress tracking
-        self.progress_file = self.output_dir / "progress.json"
+        # Progress tracking: an append-only log with one JSON filename per line
+        self.legacy_progress_file = self.output_dir / "progress.json"
+        self.progress_file = self.output_dir / "progress.jsonl"
         self.completed = self.load_progress()
+        # Unbuffered: each record is a single O_APPEND write
+        self._progress_fp = open_log(self.progress_file, buffering=0)
+        
+        # ETag/Last-Modified and iframe srcs of fetched pages, so a re-run sends
+        # conditional GETs and unchanged pages come back as bodiless 304s
+        self.page_cache_file = self.output_dir / "page_cache.jsonl"
+        self.page_cache = self.load_page_cache()
+        self._page_cache_fp = open_log(self.page_cache_file, buffering=0)
+        
+        # Single writer thread for video files and log lines, so the next
+        # anime's pages are fetched while the last one is written. One FIFO
+        # queue keeps a progress record behind the video file it refers to.
+        self._writeq: queue.Queue = queue.Queue(maxsize=64)
+        self._writer = threading.Thread(target=self._writer_loop, name='video-writer', daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
         
     def load_progress(self) -> set:
         """Load previously completed anime"""
+        completed = set()
+        
+        # Older runs rewrote a single {"completed": [...]} document
+        if self.legacy_progress_file.exists():
+            try:
+                with open(self.legacy_progress_file, 'rb') as f:
+                    completed.update(json_loads(f.read()).get('completed', []))
+            except Exception as e:
+                logger.warning(f"Could not load legacy progress file: {e}")
+        
         if self.progress_file.exists():
             try:
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return set(data.get('completed', []))
+                with open(self.progress_file, 'rb') as f:
+                    lines = f.read().split(b'\n')
+                # The last piece is empty or a line torn by a crash; skip it
+                for line in lines[:-1]:
+                    try:
+                        completed.add(json_loads(line))
+                    except ValueError:
+                        # Blank line or a record torn by an earlier crash
+                        continue
             except Exception as e:
                 logger.warning(f"Could not load progress file: {e}")
-        return set()
+        return completed
     
     def save_progress(self, anime_file: str):
-        """Save progress after completing an anime"""
+        """Save progress after completing an anime (queues one log line)"""
         self.completed.add(anime_file)
+        self._writeq.put((self.progress_file, json_dumps(anime_file) + b'\n'))
+    
+    def load_page_cache(self) -> Dict[str, Dict[str, any]]:
+        """Load cached page validators and iframe srcs, keyed by episode URL"""
+        cache = {}
+        if self.page_cache_file.exists():
+            try:
+                with open(self.page_cache_file, 'rb') as f:
+                    lines = f.read().split(b'\n')
+                # Later records for a URL replace earlier ones
+                for line in lines[:-1]:
+                    try:
+                        record = json_loads(line)
+                        cache[record['u']] = {'e': record['e'], 'm': record['m'], 's': record['s']}
+                    except (ValueError, KeyError, TypeError):
+                        # Blank line or a record torn by an earlier crash
+                        continue
+            except Exception as e:
+                logger.warning(f"Could not load page cache: {e}")
+        return cache
+    
+    def remember_page(self, url: str, headers, tree: etree._Element):
+        """Cache a fetched page's validators and iframe srcs (pages without validators are skipped)"""
+        etag = headers.get('ETag')
+        modified = headers.get('Last-Modified')
+        if not (etag or modified):
+            return
+        entry = {'e': etag, 'm': modified, 's': _iframe_srcs(tree)}
+        if self.page_cache.get(url) == entry:
+            return
         try:
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump({'completed': list(self.completed)}, f, indent=2)
-        except Exception as e:
-            logger.error(f"Could not save progress: {e}")
+            # A src lxml cannot store again (control characters) is never cached
+            _page_from_srcs(entry['s'])
+        except ValueError:
+            return
+        self.page_cache[url] = entry
+        self._writeq.put((self.page_cache_file, json_dumps({'u': url, **entry}) + b'\n'))
+    
+    def _writer_loop(self):
+        """Drain the write queue: append log lines, write video files whole"""
+        while True:
+            path, payload = self._writeq.get()
+            try:
+                if path == self.progress_file:
+                    self._progress_fp.write(payload)
+                elif path == self.page_cache_file:
+                    self._page_cache_fp.write(payload)
+                else:
+                    with open(path, 'wb') as f:
+                        f.write(payload)
+                    logger.info(f"Saved video data to: {path}")
+            except Exception as e:
+                logger.error(f"Error writing {path}: {e}")
+            finally:
+                self._writeq.task_done()
+    
+    def flush(self):
+        """Block until every queued write has reached disk"""
+        self._writeq.join()
+    
+    def close(self):
+        """Flush pending writes and close the progress and page cache logs"""
+        if not self._progress_fp.closed:
+            self.flush()
+            self._progress_fp.close()
+            self._page_cache_fp.close()
     
-    def fetch_episode_page(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_episode_page(self, url: str) -> Optional[etree._Element]:
         """
         Fetch an episode page.
         
+        A page in the page cache is requested conditionally; if the server
+        answers 304 Not Modified, the page is rebuilt from its cached iframes.
+        
         Args:
             url: URL of episode page
             
         Returns:
-            BeautifulSoup object or None if failed
+            Parsed page or None if failed
         """
+        cached = self.page_cache.get(url)
+        headers = {}
+        if cached:
+            if cached['e']:
+                headers['If-None-Match'] = cached['e']
+            if cached['m']:
+                headers['If-Modified-Since'] = cached['m']
+        
         try:
-            response = self.session.get(url, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304 and cached:
+                logger.info(f"Unchanged since last run: {url}")
+                return _page_from_srcs(cached['s'])
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            # lxml decodes the raw bytes with the charset response.text would use
+            tree = _parse_player_page(response.content, response.encoding or response.apparent_encoding)
+            self.remember_page(url, response.headers, tree)
+            return tree
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
     
-    def extract_video_sources(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    def extract_video_sources(self, tree: etree._Element, base_url: str) -> List[str]:
         """
         Extract iframe URLs from episode page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed page
             base_url: Base URL for resolving relative links
             
         Returns:
             List of iframe URLs
         """
-        iframe_urls = []
-        
-        # Find ALL iframes
-        iframes = soup.find_all('iframe')
-        for iframe in iframes:
-            src = iframe.get('src') or iframe.get('data-src') or iframe.get('data-lazy-src')
-            if src:
-                full_url = urljoin(base_url, src)
-                if full_url not in iframe_urls:
-                    iframe_urls.append(full_url)
+        # dict.fromkeys drops duplicates in one pass and keeps page order
+        join = make_url_joiner(base_url)
+        iframe_urls = list(dict.fromkeys(join(src) for src in _iframe_srcs(tree)))
         
         logger.info(f"Found {len(iframe_urls)} iframe URLs")
         return iframe_urls
@@ -140,12 +304,12 @@ class VideoUrlScraper:
         url = episode['url']
         
         # Fetch page
-        soup = self.fetch_episode_page(url)
-        if not soup:
+        tree = self.fetch_episode_page(url)
+        if tree is None:
             return None
         
         # Extract iframe URLs
-        iframe_urls = self.extract_video_sources(soup, url)
+        iframe_urls = self.extract_video_sources(tree, url)
         
         if not iframe_urls:
             logger.warning(f"No iframes found for episode {episode.get('episode_number')}")
@@ -216,33 +380,35 @@ class VideoUrlScraper:
     
     def save_video_data(self, video_data: Dict[str, any], original_filename: str):
         """
-        Save video URL data to file.
+        Serialize video URL data and queue it for the writer thread.
         
         Args:
             video_data: Dictionary with anime and video data
-            original_filename: Original episode JSON filename
+            original_filename: Original episode JSON or TOON filename
         """
-        # Create output filename (same as input but in videos dir)
-        output_file = self.videos_dir / original_filename
+        # Same name as the input but in the videos dir; always written as JSON
+        output_file = self.videos_dir / f"{Path(original_filename).stem}.json"
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(video_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Saved video data to: {output_file}")
+            payload = json_dumps(video_data, indent=True)
         except Exception as e:
             logger.error(f"Error saving video data: {e}")
+            return
+        
+        # Written by the writer thread; blocks only when the queue is full
+        self._writeq.put((output_file, payload))
     
     def scrape_all(self, episodes_dir: Path, limit: Optional[int] = None, resume: bool = True):
         """
         Scrape video URLs for all anime in episodes directory.
         
         Args:
-            episodes_dir: Directory containing episode JSON files
+            episodes_dir: Directory containing episode JSON or TOON files
             limit: Maximum number of anime to process (None for all)
             resume: Whether to resume from previous run
         """
-        # Get all episode JSON files
-        episode_files = sorted(episodes_dir.glob('*.json'))
+        # Get all episode files (JSON and TOON)
+        episode_files = sorted(list(episodes_dir.glob('*.json')) + list(episodes_dir.glob('*.toon')))
         
         if not episode_files:
             logger.error(f"No JSON files found in {episodes_dir}")
@@ -271,8 +437,7 @@ class VideoUrlScraper:
             
             try:
                 # Load episode data
-                with open(episode_file, 'r', encoding='utf-8') as f:
-                    anime_data = json.load(f)
+                anime_data = read_json_or_toon(episode_file)
                 
                 # Scrape video URLs
                 video_data = self.scrape_anime_episodes(anime_data, filename)
@@ -292,6 +457,8 @@ class VideoUrlScraper:
             except Exception as e:
                 logger.error(f"✗ Error processing {filename}: {e}", exc_info=True)
         
+        self.flush()
+        
         logger.info(f"\n{'='*60}")
         logger.info(f"Video URL scraping complete!")
         logger.info(f"Total processed: {scraped}")
@@ -2,7 +2,7 @@
 """
 Parallel Video URL Scraper
 
-Fast parallel version using threading to scrape multiple episodes simultaneously.
+Fast parallel version using asyncio to scrape multiple episodes simultaneously.
 MUCH faster than sequential version (5-10x speedup).
 
 Usage:
@@ -10,18 +10,21 @@ Usage:
     python video_url_scraper_parallel.py --input anime_data/episodes --workers 10 --limit 100
 """
 
-import requests
-from bs4 import BeautifulSoup
-import json
+import asyncio
+import atexit
+import aiohttp
+from lxml import etree
 import time
 import argparse
 import logging
-import os
+import re
+import signal
+import sys
 from typing import List, Dict, Optional
 from pathlib import Path
-from urllib.parse import urljoin
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+
+from data_io import json_dumps, json_loads, open_log, read_json_or_toon
+from html_utils import make_url_joiner, parse_page
 
 try:
     import toon
@@ -41,6 +44,58 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Iframes are found with Element.iter(), which walks the parsed tree in C.
+# Parsing a player page is quick, so it runs inline on the event loop.
+# Pages without this byte sequence cannot contain an iframe and are not parsed
+_IFRAME_TAG_RE = re.compile(rb'<iframe', re.IGNORECASE)
+# Transient responses retried with backoff (connection errors are retried too)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+# Longest Retry-After (seconds) honored on a 429/503
+_MAX_RETRY_AFTER = 60.0
+# Anime files worked on at once; the next anime's episodes fill workers left
+# idle while the previous one waits on its last few pages
+_ANIME_IN_FLIGHT = 4
+# Progress lines are written once this many are queued or this long has passed
+_PROGRESS_BATCH = 20
+_PROGRESS_FLUSH_SECS = 5.0
+
+
+def _parse_player_page(content: bytes, encoding: str) -> etree._Element:
+    """
+    Parse page bytes into an lxml tree for iframe lookup.
+    
+    An empty page, or one with no iframe tag at all, gives an empty <html>.
+    """
+    try:
+        ascii_compatible = '<iframe'.encode(encoding) == b'<iframe'
+    except (LookupError, UnicodeError):
+        ascii_compatible = False
+    # A regex sweep over the raw bytes is far cheaper than building the tree;
+    # charsets like UTF-16 spell the tag differently, so those are always parsed
+    if ascii_compatible and not _IFRAME_TAG_RE.search(content):
+        return etree.Element('html')
+    return parse_page(content, encoding)
+
+
+def _iframe_srcs(tree: etree._Element) -> List[str]:
+    """Get each iframe's URL attribute in page order (lazy-loaded players keep it in data-src)"""
+    srcs = (
+        iframe.get('src') or iframe.get('data-src') or iframe.get('data-lazy-src')
+        for iframe in tree.iter('iframe')
+    )
+    return [src for src in srcs if src]
+
+
+def _page_from_srcs(srcs: List[str]) -> etree._Element:
+    """Rebuild a page holding one iframe per src, for a cached page that is still current"""
+    root = etree.Element('html')
+    for src in srcs:
+        etree.SubElement(root, 'iframe', src=src)
+    return root
+
+
 class ParallelVideoUrlScraper:
     """Fast parallel scraper for extracting iframe URLs"""
     
@@ -50,93 +105,227 @@ class ParallelVideoUrlScraper:
         
         Args:
             output_dir: Directory to save video URL data
-            workers: Number of parallel workers (threads)
-            delay: Delay between requests per worker in seconds
+            workers: Number of episodes fetched concurrently
+            delay: Delay between requests per worker in seconds (sets the shared request rate)
             output_format: Output format - 'json' or 'toon'
         """
         self.output_dir = Path(output_dir)
         self.workers = workers
         self.delay = delay
         self.output_format = output_format
+        # Token bucket shared by all workers: refills at workers/delay requests
+        # per second and holds up to one burst of ``workers`` requests
+        self._rate = workers / delay if delay > 0 else 0.0
+        self._tokens = float(workers)
+        self._tokens_at: Optional[float] = None
         
         # Create output directories
         self.output_dir.mkdir(exist_ok=True)
         self.videos_dir = self.output_dir / "videos"
         self.videos_dir.mkdir(exist_ok=True)
         
-        # Progress tracking with thread safety
-        self.progress_file = self.output_dir / "progress.json"
+        # Progress tracking: an append-only log with one JSON filename per line
+        self.legacy_progress_file = self.output_dir / "progress.json"
+        self.progress_file = self.output_dir / "progress.jsonl"
         self.completed = self.load_progress()
-        self.lock = threading.Lock()
+        # Unbuffered: each batch of records is a single O_APPEND write
+        self._progress_fp = open_log(self.progress_file, buffering=0)
+        # Records wait here until _PROGRESS_BATCH of them or _PROGRESS_FLUSH_SECS
+        # have accumulated; at most that much progress is lost on a hard kill
+        self._pending: List[bytes] = []
+        self._last_flush = time.monotonic()
+        atexit.register(self.flush_progress)
+        
+        # ETag/Last-Modified and iframe srcs of fetched pages, so a re-run sends
+        # conditional GETs and unchanged pages come back as bodiless 304s
+        self.page_cache_file = self.output_dir / "page_cache.jsonl"
+        self.page_cache = self.load_page_cache()
+        self._page_cache_fp = open_log(self.page_cache_file)
+        atexit.register(self._page_cache_fp.flush)
         
         # Statistics
         self.stats = {
             'total_iframes': 0,
             'total_episodes': 0,
-            'failed_episodes': 0
+            'failed_episodes': 0,
+            'unchanged_pages': 0
         }
-        self.stats_lock = threading.Lock()
-        
-    def create_session(self):
-        """Create a new session for thread safety"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Referer': 'https://zoroto.com.in/'
-        })
-        return session
+        
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session shared by all workers (one connection per worker)"""
+        connector = aiohttp.TCPConnector(limit=self.workers, limit_per_host=self.workers)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+                'Referer': 'https://zoroto.com.in/'
+            },
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
     
     def load_progress(self) -> set:
         """Load previously completed anime"""
+        completed = set()
+        
+        # Older runs rewrote a single {"completed": [...]} document
+        if self.legacy_progress_file.exists():
+            try:
+                with open(self.legacy_progress_file, 'rb') as f:
+                    completed.update(json_loads(f.read()).get('completed', []))
+            except Exception as e:
+                logger.warning(f"Could not load legacy progress file: {e}")
+        
         if self.progress_file.exists():
             try:
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return set(data.get('completed', []))
+                with open(self.progress_file, 'rb') as f:
+                    lines = f.read().split(b'\n')
+                # The last piece is empty or a line torn by a crash; skip it
+                for line in lines[:-1]:
+                    try:
+                        completed.add(json_loads(line))
+                    except ValueError:
+                        # Blank line or a record torn by an earlier crash
+                        continue
             except Exception as e:
                 logger.warning(f"Could not load progress file: {e}")
-        return set()
+        return completed
     
     def save_progress(self, anime_file: str):
-        """Save progress (thread-safe)"""
-        with self.lock:
-            self.completed.add(anime_file)
+        """Save progress after completing an anime (queues one log line and writes in batches)"""
+        self.completed.add(anime_file)
+        self._pending.append(json_dumps(anime_file) + b'\n')
+        if (len(self._pending) >= _PROGRESS_BATCH
+                or time.monotonic() - self._last_flush >= _PROGRESS_FLUSH_SECS):
+            self.flush_progress()
+    
+    def flush_progress(self):
+        """Append all queued progress lines to the log"""
+        if not self._pending:
+            return
+        try:
+            self._progress_fp.write(b''.join(self._pending))
+        except Exception as e:
+            logger.error(f"Could not save progress: {e}")
+        self._pending.clear()
+        self._last_flush = time.monotonic()
+    
+    def load_page_cache(self) -> Dict[str, Dict[str, any]]:
+        """Load cached page validators and iframe srcs, keyed by episode URL"""
+        cache = {}
+        if self.page_cache_file.exists():
             try:
-                with open(self.progress_file, 'w', encoding='utf-8') as f:
-                    json.dump({'completed': list(self.completed)}, f, indent=2)
+                with open(self.page_cache_file, 'rb') as f:
+                    lines = f.read().split(b'\n')
+                # Later records for a URL replace earlier ones
+                for line in lines[:-1]:
+                    try:
+                        record = json_loads(line)
+                        cache[record['u']] = {'e': record['e'], 'm': record['m'], 's': record['s']}
+                    except (ValueError, KeyError, TypeError):
+                        # Blank line or a record torn by an earlier crash
+                        continue
             except Exception as e:
-                logger.error(f"Could not save progress: {e}")
+                logger.warning(f"Could not load page cache: {e}")
+        return cache
     
-    def fetch_episode_page(self, url: str, session: requests.Session) -> Optional[BeautifulSoup]:
-        """Fetch an episode page"""
+    def remember_page(self, url: str, headers, tree: etree._Element):
+        """Cache a fetched page's validators and iframe srcs (pages without validators are skipped)"""
+        etag = headers.get('ETag')
+        modified = headers.get('Last-Modified')
+        if not (etag or modified):
+            return
+        entry = {'e': etag, 'm': modified, 's': _iframe_srcs(tree)}
+        if self.page_cache.get(url) == entry:
+            return
         try:
-            response = session.get(url, timeout=30)
-            response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
-        except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {e}")
-            return None
+            # A src lxml cannot store again (control characters) is never cached
+            _page_from_srcs(entry['s'])
+        except ValueError:
+            return
+        self.page_cache[url] = entry
+        try:
+            self._page_cache_fp.write(json_dumps({'u': url, **entry}) + b'\n')
+        except Exception as e:
+            logger.error(f"Could not save page cache: {e}")
+    
+    async def wait_for_token(self):
+        """
+        Take a request token from the shared bucket, waiting for one if it is empty.
+        
+        Idle workers may burst up to ``workers`` requests at once while the
+        aggregate rate stays at ``workers / delay`` requests per second.
+        """
+        if not self._rate:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        # No await between read and write, so the reservation is atomic on the loop
+        if self._tokens_at is not None:
+            self._tokens = min(float(self.workers), self._tokens + (now - self._tokens_at) * self._rate)
+        self._tokens_at = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            # Owed tokens queue up: each waiter sleeps until its own token is refilled
+            await asyncio.sleep(-self._tokens / self._rate)
     
-    def extract_iframe_urls(self, soup: BeautifulSoup, base_url: str) -> List[str]:
+    async def fetch_episode_page(self, url: str, session: aiohttp.ClientSession) -> Optional[etree._Element]:
+        """
+        Fetch and parse an episode page, retrying connection errors and 429/5xx responses.
+        
+        A page in the page cache is requested conditionally; if the server
+        answers 304 Not Modified, the page is rebuilt from its cached iframes.
+        """
+        cached = self.page_cache.get(url)
+        headers = {}
+        if cached:
+            if cached['e']:
+                headers['If-None-Match'] = cached['e']
+            if cached['m']:
+                headers['If-Modified-Since'] = cached['m']
+        
+        for attempt in range(_MAX_RETRIES + 1):
+            wait = _BACKOFF_FACTOR * 2 ** attempt
+            try:
+                await self.wait_for_token()
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304 and cached:
+                        self.stats['unchanged_pages'] += 1
+                        return _page_from_srcs(cached['s'])
+                    if response.status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                        response.raise_for_status()
+                        content = await response.read()
+                        # The site is utf-8 when no charset header is sent
+                        encoding = response.charset or 'utf-8'
+                        # lxml decodes the raw bytes in C
+                        tree = _parse_player_page(content, encoding)
+                        self.remember_page(url, response.headers, tree)
+                        return tree
+                    retry_after = response.headers.get('Retry-After', '').strip()
+                    if retry_after.isdigit():
+                        wait = max(wait, min(_MAX_RETRY_AFTER, float(retry_after)))
+            except aiohttp.ClientResponseError as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == _MAX_RETRIES:
+                    logger.error(f"Error fetching {url}: {e or type(e).__name__}")
+                    return None
+            await asyncio.sleep(wait)
+    
+    def extract_iframe_urls(self, tree: etree._Element, base_url: str) -> List[str]:
         """Extract iframe URLs from page"""
-        iframe_urls = []
-        iframes = soup.find_all('iframe')
-        for iframe in iframes:
-            src = iframe.get('src') or iframe.get('data-src') or iframe.get('data-lazy-src')
-            if src:
-                full_url = urljoin(base_url, src)
-                if full_url not in iframe_urls:
-                    iframe_urls.append(full_url)
-        return iframe_urls
+        # dict.fromkeys drops duplicates in one pass and keeps page order
+        join = make_url_joiner(base_url)
+        return list(dict.fromkeys(join(src) for src in _iframe_srcs(tree)))
     
-    def scrape_episode(self, episode: Dict[str, str], session: requests.Session) -> Dict[str, any]:
+    async def scrape_episode(self, episode: Dict[str, str], session: aiohttp.ClientSession) -> Dict[str, any]:
         """Scrape a single episode"""
         url = episode['url']
         
         # Fetch page
-        soup = self.fetch_episode_page(url, session)
+        tree = await self.fetch_episode_page(url, session)
         
-        if not soup:
+        if tree is None:
             return {
                 'episode_number': episode.get('episode_number'),
                 'episode_url': url,
@@ -145,17 +334,13 @@ class ParallelVideoUrlScraper:
             }
         
         # Extract iframes
-        iframe_urls = self.extract_iframe_urls(soup, url)
+        iframe_urls = self.extract_iframe_urls(tree, url)
         
         # Update stats
-        with self.stats_lock:
-            self.stats['total_episodes'] += 1
-            self.stats['total_iframes'] += len(iframe_urls)
-            if not iframe_urls:
-                self.stats['failed_episodes'] += 1
-        
-        # Rate limiting per worker
-        time.sleep(self.delay)
+        self.stats['total_episodes'] += 1
+        self.stats['total_iframes'] += len(iframe_urls)
+        if not iframe_urls:
+            self.stats['failed_episodes'] += 1
         
         return {
             'episode_number': episode.get('episode_number'),
@@ -163,12 +348,15 @@ class ParallelVideoUrlScraper:
             'iframe_urls': iframe_urls
         }
     
-    def scrape_anime_parallel(self, anime_data: Dict[str, any]) -> Dict[str, any]:
+    async def scrape_anime_async(self, anime_data: Dict[str, any], session: aiohttp.ClientSession,
+                                 sem: Optional[asyncio.Semaphore] = None) -> Dict[str, any]:
         """
-        Scrape all episodes of an anime in parallel.
+        Scrape all episodes of an anime concurrently, at most ``workers`` at a time.
         
         Args:
             anime_data: Anime data with episodes
+            session: HTTP session to fetch with
+            sem: Episode slots shared with other anime being scraped, if any
             
         Returns:
             Complete anime data with iframe URLs
@@ -176,41 +364,30 @@ class ParallelVideoUrlScraper:
         title = anime_data.get('title', 'Unknown')
         episodes = anime_data.get('episodes', [])
         
-        logger.info(f"Scraping {len(episodes)} episodes with {self.workers} workers")
+        logger.info(f"Scraping {len(episodes)} episodes of {title} with {self.workers} workers")
         
-        episodes_with_iframes = []
+        if sem is None:
+            sem = asyncio.Semaphore(self.workers)
         
-        # Process episodes in parallel
-        with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            # Create a session per thread
-            sessions = {}
-            
-            def get_session():
-                thread_id = threading.get_ident()
-                if thread_id not in sessions:
-                    sessions[thread_id] = self.create_session()
-                return sessions[thread_id]
-            
-            # Submit all episodes
-            future_to_episode = {
-                executor.submit(self.scrape_episode, episode, get_session()): episode
-                for episode in episodes
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_episode):
-                try:
-                    result = future.result()
-                    episodes_with_iframes.append(result)
-                except Exception as e:
-                    episode = future_to_episode[future]
-                    logger.error(f"Error scraping episode {episode.get('episode_number')}: {e}")
-                    episodes_with_iframes.append({
-                        'episode_number': episode.get('episode_number'),
-                        'episode_url': episode.get('url'),
-                        'iframe_urls': [],
-                        'error': str(e)
-                    })
+        async def bounded_scrape(episode):
+            async with sem:
+                return await self.scrape_episode(episode, session)
+        
+        results = await asyncio.gather(
+            *(bounded_scrape(episode) for episode in episodes), return_exceptions=True
+        )
+        
+        episodes_with_iframes = []
+        for episode, result in zip(episodes, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error scraping episode {episode.get('episode_number')}: {result}")
+                result = {
+                    'episode_number': episode.get('episode_number'),
+                    'episode_url': episode.get('url'),
+                    'iframe_urls': [],
+                    'error': str(result)
+                }
+            episodes_with_iframes.append(result)
         
         # Sort by episode number for consistent output
         episodes_with_iframes.sort(key=lambda x: str(x.get('episode_number', '')))
@@ -223,6 +400,50 @@ class ParallelVideoUrlScraper:
         
         return result
     
+    async def process_anime_file(self, i: int, total: int, episode_file: Path,
+                                 session: aiohttp.ClientSession, sem: asyncio.Semaphore) -> bool:
+        """
+        Load one episode file, scrape its episodes and save the video data.
+        
+        Args:
+            i: Position of the file in the run (for logging)
+            total: Number of files in the run
+            episode_file: Episode JSON or TOON file
+            session: HTTP session to fetch with
+            sem: Episode slots shared by all anime in flight
+            
+        Returns:
+            True if the anime was scraped and saved
+        """
+        filename = episode_file.name
+        logger.info(f"\n{'='*60}")
+        logger.info(f"Processing {i}/{total}: {filename}")
+        logger.info(f"{'='*60}")
+        
+        loop = asyncio.get_running_loop()
+        try:
+            # Load episode data (file I/O stays off the event loop)
+            anime_data = await loop.run_in_executor(None, self.load_episode_file, episode_file)
+            if not anime_data:
+                return False
+            
+            # Scrape in parallel
+            video_data = await self.scrape_anime_async(anime_data, session, sem)
+            
+            # Save results
+            await loop.run_in_executor(None, self.save_video_data, video_data, filename)
+            
+            # Mark as completed
+            self.save_progress(filename)
+            
+            # Count total iframes
+            total_iframes = sum(len(ep.get('iframe_urls', [])) for ep in video_data.get('episodes', []))
+            logger.info(f"✓ Successfully scraped: {anime_data.get('title')} ({total_iframes} iframe URLs)")
+            return True
+        except Exception as e:
+            logger.error(f"✗ Error processing {filename}: {e}", exc_info=True)
+            return False
+    
     def save_video_data(self, video_data: Dict[str, any], original_filename: str):
         """Save video URL data"""
         # Adjust extension based on format
@@ -239,31 +460,37 @@ class ParallelVideoUrlScraper:
                 with open(output_file, 'w', encoding='utf-8') as f:
                     f.write(toon_str)
             else:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(video_data, f, ensure_ascii=False, indent=2)
+                with open(output_file, 'wb') as f:
+                    f.write(json_dumps(video_data, indent=True))
         except Exception as e:
             logger.error(f"Error saving video data: {e}")
     
     def load_episode_file(self, filepath: Path) -> Optional[Dict]:
         """Load episode data from JSON or TOON file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            if filepath.suffix == '.toon':
-            if not TOON_AVAILABLE:
-                logger.error("python-toon not installed. Run: pip install python-toon")
-                return None
-            return toon.decode(content)
-            else:
-                return json.loads(content)
+            return read_json_or_toon(filepath)
         except Exception as e:
             logger.error(f"Error loading {filepath}: {e}")
             return None
     
     def scrape_all(self, episodes_dir: Path, limit: Optional[int] = None, resume: bool = True):
         """
-        Scrape video URLs for all anime in parallel.
+        Scrape video URLs for all anime in parallel (runs the event loop until done).
+        
+        Args:
+            episodes_dir: Directory containing episode JSON or TOON files
+            limit: Maximum number of anime to process
+            resume: Whether to resume from previous run
+        """
+        try:
+            asyncio.run(self.scrape_all_async(episodes_dir, limit=limit, resume=resume))
+        finally:
+            self.flush_progress()
+            self._page_cache_fp.flush()
+    
+    async def scrape_all_async(self, episodes_dir: Path, limit: Optional[int] = None, resume: bool = True):
+        """
+        Scrape video URLs for all anime, a few anime at a time with their episodes in parallel.
         
         Args:
             episodes_dir: Directory containing episode JSON or TOON files
@@ -289,46 +516,35 @@ class ParallelVideoUrlScraper:
         start_time = time.time()
         scraped = 0
         
+        todo = []
         for i, episode_file in enumerate(episode_files, 1):
-            filename = episode_file.name
-            
             # Skip if already completed
-            if resume and filename in self.completed:
-                logger.info(f"[{i}/{total}] Skipping completed: {filename}")
+            if resume and episode_file.name in self.completed:
+                logger.info(f"[{i}/{total}] Skipping completed: {episode_file.name}")
                 continue
+            todo.append((i, episode_file))
+        
+        async with self.create_session() as session:
+            # Episode slots are shared, so several anime in flight never open
+            # more than ``workers`` requests between them
+            episode_sem = asyncio.Semaphore(self.workers)
+            anime_sem = asyncio.Semaphore(_ANIME_IN_FLIGHT)
             
-            logger.info(f"\n{'='*60}")
-            logger.info(f"Processing {i}/{total}: {filename}")
-            logger.info(f"{'='*60}")
+            async def bounded_process(i, episode_file):
+                async with anime_sem:
+                    return await self.process_anime_file(i, total, episode_file, session, episode_sem)
             
-            try:
-                # Load episode data
-                anime_data = self.load_episode_file(episode_file)
-                if not anime_data:
+            tasks = [asyncio.create_task(bounded_process(i, f)) for i, f in todo]
+            for done, task in enumerate(asyncio.as_completed(tasks), 1):
+                if not await task:
                     continue
-                
-                # Scrape in parallel
-                video_data = self.scrape_anime_parallel(anime_data)
-                
-                # Save results
-                self.save_video_data(video_data, filename)
-                
-                # Mark as completed
-                self.save_progress(filename)
                 scraped += 1
                 
-                # Count total iframes
-                total_iframes = sum(len(ep.get('iframe_urls', [])) for ep in video_data.get('episodes', []))
-                logger.info(f"✓ Successfully scraped: {anime_data.get('title')} ({total_iframes} iframe URLs)")
-                
                 # Show progress stats
                 elapsed = time.time() - start_time
-                avg_time = elapsed / scraped if scraped > 0 else 0
-                remaining = (total - i) * avg_time
+                avg_time = elapsed / scraped
+                remaining = (len(todo) - done) * avg_time
                 logger.info(f"Progress: {scraped}/{total} | Avg: {avg_time:.1f}s/anime | ETA: {remaining/60:.1f}min")
-                
-            except Exception as e:
-                logger.error(f"✗ Error processing {filename}: {e}", exc_info=True)
         
         # Final stats
         elapsed = time.time() - start_time
@@ -338,6 +554,7 @@ class ParallelVideoUrlScraper:
         logger.info(f"Total episodes scraped: {self.stats['total_episodes']}")
         logger.info(f"Total iframe URLs found: {self.stats['total_iframes']}")
         logger.info(f"Failed episodes: {self.stats['failed_episodes']}")
+        logger.info(f"Unchanged pages (304): {self.stats['unchanged_pages']}")
         logger.info(f"Time taken: {elapsed/60:.1f} minutes")
         logger.info(f"Average: {elapsed/scraped:.1f}s per anime" if scraped > 0 else "")
         logger.info(f"Output directory: {self.videos_dir}")
@@ -421,6 +638,10 @@ def main():
         output_format=args.format
     )
     
+    # Exit normally on SIGTERM so queued progress is flushed, as it already
+    # is on Ctrl+C (KeyboardInterrupt)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    
     # Start scraping
     scraper.scrape_all(
         episodes_dir=episodes_dir,
@@ -10,16 +10,25 @@ Usage:
     python zoroto_scraper.py --output anime_list.json --max-pages 10
 """
 
+import asyncio
+import atexit
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-import json
-import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
 import argparse
 import logging
-from typing import List, Dict, Optional
+import re
+import time
+from typing import Iterator, List, Dict, Optional
+from pathlib import Path
 from urllib.parse import urljoin
 import sys
 
+from data_io import json_dumps, json_loads, open_log
+from html_utils import has_class, parse_page, visible_text
+
 try:
     import toon
     TOON_AVAILABLE = True
@@ -34,26 +43,274 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Pages are queried with compiled XPath, so the walk over the list cards runs in C
+_ARTICLES_XPATH = etree.XPath(f"//article[{has_class('bs')}]")
+_ARTICLE_LINK_XPATH = etree.XPath(f"((.//div[{has_class('bsx')}])[1]//a[@itemprop = 'url'])[1]")
+_HEADLINE_XPATH = etree.XPath("(.//h2[@itemprop = 'headline'])[1]")
+# The cheap contains() test rules out most divs before the exact class-token match runs
+_PAGINATION_XPATH = etree.XPath(f"(//div[contains(@class, 'pagination')][{has_class('pagination')}])[1]")
+# Page-number links and the first current-page span in one walk, in document order
+_PAGE_NUMBERS_XPATH = etree.XPath(
+    f".//a[{has_class('page-numbers')}] | (.//span[{has_class('current')}])[1]"
+)
+# Page number of a pagination link like /az-list/page/2/?show=A
+_PAGE_HREF_RE = re.compile(r'/page/(\d+)(?:[/?]|\Z)')
+# Transient responses retried with backoff (connection errors are retried too)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+# Longest Retry-After / X-RateLimit-Reset wait (seconds) honored
+_MAX_RETRY_AFTER = 60.0
+
+
+def _rate_limit_wait(headers) -> Optional[float]:
+    """Seconds until the site's rate limit resets, if X-RateLimit-* headers say it is used up"""
+    if headers.get('X-RateLimit-Remaining', '').strip() != '0':
+        return None
+    reset = headers.get('X-RateLimit-Reset', '').strip()
+    if not reset.isdigit():
+        return None
+    # Sent either as seconds to wait or as a Unix timestamp
+    wait = float(reset)
+    if wait > 1e9:
+        wait -= time.time()
+    return min(_MAX_RETRY_AFTER, max(0.0, wait))
+
+
+def _anime_items(articles: List[etree._Element]) -> List[Dict[str, str]]:
+    """Get the title and URL of each <article class="bs"> card that has both"""
+    anime_list = []
+    for article in articles:
+        # Find the link inside <div class="bsx">
+        for link in _ARTICLE_LINK_XPATH(article):
+            title = link.get('title', '')
+            url = link.get('href', '')
+            
+            # Also try to get title from h2 if not available
+            if not title:
+                for h2 in _HEADLINE_XPATH(link):
+                    title = visible_text(h2)
+            
+            if url and title:
+                anime_list.append({
+                    'title': title,
+                    'url': url
+                })
+    return anime_list
+
+
+def _max_page_number(tree: etree._Element) -> Optional[int]:
+    """Get the highest page number in the page's pagination block (None if it has none)"""
+    # Find pagination: <div class="pagination">
+    pagination = next(iter(_PAGINATION_XPATH(tree)), None)
+    if pagination is None:
+        return None
+    
+    # Page number links, plus the current page span
+    max_page = 1
+    for node in _PAGE_NUMBERS_XPATH(pagination):
+        text = visible_text(node)
+        if node.tag == 'a':
+            # Skip "Next" links
+            if 'next' in text.lower():
+                continue
+            # Try to extract page number from href
+            match = _PAGE_HREF_RE.search(node.get('href', ''))
+            if match:
+                max_page = max(max_page, int(match.group(1)))
+        
+        # Also try to get from text
+        if text.isdigit():
+            max_page = max(max_page, int(text))
+    
+    return max_page
+
+
+def _page_from_cache(items: List[List[str]], max_page: Optional[int]) -> etree._Element:
+    """Rebuild a list page from its cached anime and page count, for a page that is still current"""
+    root = etree.Element('html')
+    for title, url in items:
+        article = etree.SubElement(root, 'article', {'class': 'bs'})
+        bsx = etree.SubElement(article, 'div', {'class': 'bsx'})
+        etree.SubElement(bsx, 'a', {'itemprop': 'url', 'title': title, 'href': url})
+    if max_page is not None:
+        pagination = etree.SubElement(root, 'div', {'class': 'pagination'})
+        etree.SubElement(pagination, 'span', {'class': 'current'}).text = str(max_page)
+    return root
+
+
 class ZorotoAnimeListScraper:
     """Scraper for zoroto.com.in anime list"""
     
     def __init__(self, base_url: str = "https://zoroto.com.in/az-list/", 
-                 delay: float = 1.0):
+                 delay: float = 1.0, workers: int = 8, page_cache_file: Optional[str] = None):
         """
         Initialize the scraper.
         
         Args:
             base_url: Base URL for the anime list page
-            delay: Delay between requests in seconds (be respectful!)
+            delay: Minimum delay between request starts in seconds (be respectful!)
+            workers: Maximum number of list pages fetched concurrently
+            page_cache_file: JSONL file caching list pages between runs (None to disable)
         """
         self.base_url = base_url
         self.delay = delay
+        self.workers = workers
         self.session = requests.Session()
+        # Blocking fetches go one at a time, so a single kept-alive connection
+        # per host is all the pool needs; the adapter also retries transient failures
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=1,
+            max_retries=Retry(
+                total=_MAX_RETRIES,
+                backoff_factor=_BACKOFF_FACTOR,
+                status_forcelist=_RETRY_STATUSES
+            )
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Token bucket holding a single token that refills every ``delay``
+        # seconds, so concurrent fetches still start at least ``delay`` apart.
+        # A 429 halves the refill rate and each success wins back an eighth of
+        # the configured rate, so the scraper settles just under the site's limit
+        self._max_rate = 1 / delay if delay > 0 else 0.0
+        self._rate = self._max_rate
+        self._tokens = 1.0
+        self._tokens_at: Optional[float] = None
+        # Loop time before which no request starts (set from Retry-After and
+        # X-RateLimit-* headers, so one throttled response pauses every fetch)
+        self._resume_at = 0.0
+        
+        # ETag/Last-Modified and extracted anime of fetched list pages, so a
+        # re-run sends conditional GETs and unchanged pages come back as bodiless 304s
+        self.page_cache_file = Path(page_cache_file) if page_cache_file else None
+        self.page_cache = self.load_page_cache()
+        self._page_cache_fp = None
+        if self.page_cache_file:
+            self._page_cache_fp = open_log(self.page_cache_file)
+            atexit.register(self._page_cache_fp.flush)
+        
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session for concurrent page fetches (one connection per worker)"""
+        connector = aiohttp.TCPConnector(limit=self.workers, limit_per_host=self.workers)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={'User-Agent': self.session.headers['User-Agent']},
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    
+    def load_page_cache(self) -> Dict[str, Dict[str, any]]:
+        """Load cached page validators and anime, keyed by list page URL"""
+        cache = {}
+        if self.page_cache_file and self.page_cache_file.exists():
+            try:
+                with open(self.page_cache_file, 'rb') as f:
+                    lines = f.read().split(b'\n')
+                # Later records for a URL replace earlier ones
+                for line in lines[:-1]:
+                    try:
+                        record = json_loads(line)
+                        cache[record['u']] = {'e': record['e'], 'm': record['m'], 'a': record['a'], 'p': record['p']}
+                    except (ValueError, KeyError, TypeError):
+                        # Blank line or a record torn by an earlier crash
+                        continue
+            except Exception as e:
+                logger.warning(f"Could not load page cache: {e}")
+        return cache
+    
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached page (empty if not cached)"""
+        cached = self.page_cache.get(url)
+        headers = {}
+        if cached:
+            if cached['e']:
+                headers['If-None-Match'] = cached['e']
+            if cached['m']:
+                headers['If-Modified-Since'] = cached['m']
+        return headers
+    
+    def cached_page(self, url: str) -> etree._Element:
+        """Rebuild a page the server reported as not modified from its cache entry"""
+        logger.info(f"Unchanged since last run: {url}")
+        cached = self.page_cache[url]
+        return _page_from_cache(cached['a'], cached['p'])
+    
+    def remember_page(self, url: str, headers, tree: etree._Element):
+        """Cache a fetched page's validators and anime (pages without validators are skipped)"""
+        etag = headers.get('ETag')
+        modified = headers.get('Last-Modified')
+        if self._page_cache_fp is None or not (etag or modified):
+            return
+        try:
+            items = [[anime['title'], anime['url']] for anime in _anime_items(_ARTICLES_XPATH(tree))]
+            entry = {'e': etag, 'm': modified, 'a': items, 'p': _max_page_number(tree)}
+            if self.page_cache.get(url) == entry:
+                return
+            # A title lxml cannot store again (control characters) is never cached
+            _page_from_cache(entry['a'], entry['p'])
+        except ValueError:
+            return
+        self.page_cache[url] = entry
+        try:
+            self._page_cache_fp.write(json_dumps({'u': url, **entry}) + b'\n')
+        except Exception as e:
+            logger.error(f"Could not save page cache: {e}")
+    
+    def page_url(self, page_num: Optional[int] = None, letter: Optional[str] = None) -> str:
+        """Build the URL of a list page (None or 1 for the first page)"""
+        if letter:
+            if page_num and page_num > 1:
+                return f"{self.base_url}page/{page_num}/?show={letter}"
+            return f"{self.base_url}?show={letter}"
+        if page_num and page_num > 1:
+            return f"{self.base_url}page/{page_num}/"
+        return self.base_url
+    
+    def page_urls(self, pages: int, letter: Optional[str] = None) -> Iterator[str]:
+        """Yield the URLs of list pages 2..pages of one listing"""
+        prefix = f"{self.base_url}page/"
+        suffix = f"/?show={letter}" if letter else "/"
+        for page_num in range(2, pages + 1):
+            yield f"{prefix}{page_num}{suffix}"
+    
+    async def wait_for_token(self):
+        """Wait until the next request may start, at most one per ``delay`` seconds"""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        while self._resume_at > now:
+            await asyncio.sleep(self._resume_at - now)
+            now = loop.time()
+        if not self._rate:
+            return
+        # No await between read and write, so the reservation is atomic on the loop
+        if self._tokens_at is not None:
+            self._tokens = min(1.0, self._tokens + (now - self._tokens_at) * self._rate)
+        self._tokens_at = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            # Owed tokens queue up: each waiter sleeps until its own token is refilled
+            await asyncio.sleep(-self._tokens / self._rate)
+    
+    def pause_requests(self, wait: float):
+        """Hold back every request for ``wait`` seconds"""
+        self._resume_at = max(self._resume_at, asyncio.get_running_loop().time() + wait)
+    
+    def slow_down(self):
+        """Halve the request rate after a 429 (down to a sixteenth of the configured rate)"""
+        if self._rate:
+            self._rate = max(self._max_rate / 16, self._rate / 2)
+            logger.warning(f"Rate limited, slowing to {self._rate:.2f} requests/s")
+    
+    def speed_up(self):
+        """Win back part of the configured request rate after a successful response"""
+        if self._rate < self._max_rate:
+            self._rate = min(self._max_rate, self._rate + self._max_rate / 8)
         
-    def fetch_page(self, page_num: Optional[int] = None, letter: Optional[str] = None) -> Optional[BeautifulSoup]:
+    def fetch_page(self, page_num: Optional[int] = None, letter: Optional[str] = None) -> Optional[etree._Element]:
         """
         Fetch a page from the anime list.
         
@@ -62,128 +319,120 @@ class ZorotoAnimeListScraper:
             letter: Letter filter to apply (e.g., 'A', '0-9')
             
         Returns:
-            BeautifulSoup object or None if request failed
+            Parsed page (lxml tree) or None if request failed
         """
         try:
-            if letter:
-                if page_num and page_num > 1:
-                    url = f"{self.base_url}page/{page_num}/?show={letter}"
-                else:
-                    url = f"{self.base_url}?show={letter}"
-            elif page_num and page_num > 1:
-                url = f"{self.base_url}page/{page_num}/"
-            else:
-                url = self.base_url
-                
+            url = self.page_url(page_num, letter)
             logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=30)
+            response = self.session.get(url, headers=self.conditional_headers(url), timeout=30)
+            if response.status_code == 304 and url in self.page_cache:
+                return self.cached_page(url)
             response.raise_for_status()
             
-            return BeautifulSoup(response.text, 'html.parser')
+            # Same charset choice as response.text, but lxml decodes the raw bytes itself
+            tree = parse_page(response.content, response.encoding or response.apparent_encoding)
+            self.remember_page(url, response.headers, tree)
+            return tree
             
         except requests.RequestException as e:
             logger.error(f"Error fetching page {page_num}: {e}")
             return None
     
-    def extract_anime_list(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    async def fetch_page_async(self, session: aiohttp.ClientSession, url: str) -> Optional[etree._Element]:
+        """
+        Fetch a page from the anime list without blocking other fetches.
+        
+        Connection errors and 429/5xx responses are retried with exponential
+        backoff; Retry-After and exhausted X-RateLimit-* quotas pause all fetches.
+        A page in the page cache is requested conditionally and rebuilt from
+        the cache if the server answers 304 Not Modified.
+        
+        Args:
+            session: Session from create_session()
+            url: List page URL, from page_url() or page_urls()
+            
+        Returns:
+            Parsed page (lxml tree) or None if request failed
+        """
+        headers = self.conditional_headers(url)
+        for attempt in range(_MAX_RETRIES + 1):
+            wait = _BACKOFF_FACTOR * 2 ** attempt
+            try:
+                await self.wait_for_token()
+                logger.info(f"Fetching: {url}")
+                async with session.get(url, headers=headers) as response:
+                    reset_wait = _rate_limit_wait(response.headers)
+                    if reset_wait:
+                        self.pause_requests(reset_wait)
+                    if response.status == 304 and url in self.page_cache:
+                        self.speed_up()
+                        return self.cached_page(url)
+                    if response.status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                        response.raise_for_status()
+                        content = await response.read()
+                        self.speed_up()
+                        # The site is utf-8 when no charset header is sent
+                        tree = parse_page(content, response.charset or 'utf-8')
+                        self.remember_page(url, response.headers, tree)
+                        return tree
+                    retry_after = response.headers.get('Retry-After', '').strip()
+                    if retry_after.isdigit():
+                        wait = max(wait, min(_MAX_RETRY_AFTER, float(retry_after)))
+                        self.pause_requests(wait)
+                    if response.status == 429:
+                        self.slow_down()
+            except aiohttp.ClientResponseError as e:
+                logger.error(f"Error fetching {url}: {e}")
+                return None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == _MAX_RETRIES:
+                    logger.error(f"Error fetching {url}: {e or type(e).__name__}")
+                    return None
+            await asyncio.sleep(wait)
+    
+    def extract_anime_list(self, tree: etree._Element) -> List[Dict[str, str]]:
         """
         Extract anime titles and URLs from a page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed page from fetch_page()
             
         Returns:
             List of dictionaries with 'title' and 'url' keys
         """
-        anime_list = []
-        
         # Find all anime article items: <article class="bs">
-        articles = soup.find_all('article', class_='bs')
+        articles = _ARTICLES_XPATH(tree)
         
         if not articles:
             logger.warning("Could not find anime articles on page")
-            return anime_list
-        
-        # Extract all anime items
-        for article in articles:
-            # Find the link inside <div class="bsx">
-            bsx = article.find('div', class_='bsx')
-            if bsx:
-                link = bsx.find('a', itemprop='url')
-                if link:
-                    title = link.get('title', '')
-                    url = link.get('href', '')
-                    
-                    # Also try to get title from h2 if not available
-                    if not title:
-                        h2 = link.find('h2', itemprop='headline')
-                        if h2:
-                            title = h2.get_text(strip=True)
-                    
-                    if url and title:
-                        anime_list.append({
-                            'title': title,
-                            'url': url
-                        })
+            return []
         
+        anime_list = _anime_items(articles)
         logger.info(f"Found {len(anime_list)} anime on this page")
         return anime_list
     
-    def get_max_page_number(self, soup: BeautifulSoup) -> int:
+    def get_max_page_number(self, tree: etree._Element) -> int:
         """
         Determine the maximum page number from pagination.
         
         Args:
-            soup: BeautifulSoup object of the page
+            tree: Parsed page from fetch_page()
             
         Returns:
             Maximum page number
         """
         try:
-            # Find pagination: <div class="pagination">
-            pagination = soup.find('div', class_='pagination')
-            if not pagination:
-                logger.warning("No pagination found, assuming single page")
-                return 1
-            
-            # Find all page number links
-            page_links = pagination.find_all('a', class_='page-numbers')
-            max_page = 1
-            
-            for link in page_links:
-                # Skip "Next" links
-                if 'next' in link.get_text(strip=True).lower():
-                    continue
-                    
-                # Try to extract page number from href
-                href = link.get('href', '')
-                if '/page/' in href:
-                    try:
-                        # Extract number from URL like /page/2/
-                        page_part = href.split('/page/')[-1]
-                        page_num = int(page_part.rstrip('/').split('/')[0].split('?')[0])
-                        max_page = max(max_page, page_num)
-                    except (ValueError, IndexError):
-                        pass
-                
-                # Also try to get from text
-                text = link.get_text(strip=True)
-                if text.isdigit():
-                    max_page = max(max_page, int(text))
-            
-            # Check for current page span
-            current_span = pagination.find('span', class_='current')
-            if current_span:
-                text = current_span.get_text(strip=True)
-                if text.isdigit():
-                    max_page = max(max_page, int(text))
-            
-            logger.info(f"Detected maximum page number: {max_page}")
-            return max_page
-            
+            max_page = _max_page_number(tree)
         except Exception as e:
             logger.error(f"Error detecting max page: {e}")
             return 1
+        
+        if max_page is None:
+            logger.warning("No pagination found, assuming single page")
+            return 1
+        
+        logger.info(f"Detected maximum page number: {max_page}")
+        return max_page
     
     def scrape_all_pages(self, max_pages: Optional[int] = None, letter: Optional[str] = None) -> List[Dict[str, str]]:
         """
@@ -196,13 +445,33 @@ class ZorotoAnimeListScraper:
         Returns:
             List of all anime with titles and URLs
         """
+        return asyncio.run(self.scrape_all_pages_async(max_pages=max_pages, letter=letter))
+    
+    async def scrape_all_pages_async(self, max_pages: Optional[int] = None,
+                                     letter: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Scrape all pages of the anime list, fetching pages after the first concurrently.
+        
+        Args:
+            max_pages: Maximum number of pages to scrape (None for all)
+            letter: Optional letter filter
+            
+        Returns:
+            List of all anime with titles and URLs, in page order
+        """
+        async with self.create_session() as session:
+            return await self._scrape_pages(session, max_pages, letter)
+    
+    async def _scrape_pages(self, session: aiohttp.ClientSession, max_pages: Optional[int],
+                            letter: Optional[str]) -> List[Dict[str, str]]:
+        """Scrape all pages of one listing over an open session"""
         all_anime = []
         
         # Fetch first page to determine total pages
         logger.info("Fetching first page to detect total pages...")
-        first_page = self.fetch_page(letter=letter)
+        first_page = await self.fetch_page_async(session, self.page_url(letter=letter))
         
-        if not first_page:
+        if first_page is None:
             logger.error("Failed to fetch first page")
             return all_anime
         
@@ -218,14 +487,15 @@ class ZorotoAnimeListScraper:
         
         logger.info(f"Will scrape {total_pages} pages total")
         
-        # Scrape remaining pages
-        for page_num in range(2, total_pages + 1):
-            # Rate limiting
-            time.sleep(self.delay)
-            
-            soup = self.fetch_page(page_num, letter=letter)
-            if soup:
-                anime_list = self.extract_anime_list(soup)
+        # Scrape remaining pages: they only depend on total_pages, so all are
+        # requested at once; the connector and token bucket bound the load
+        page_nums = range(2, total_pages + 1)
+        trees = await asyncio.gather(
+            *(self.fetch_page_async(session, url) for url in self.page_urls(total_pages, letter))
+        )
+        for page_num, tree in zip(page_nums, trees):
+            if tree is not None:
+                anime_list = self.extract_anime_list(tree)
                 all_anime.extend(anime_list)
             else:
                 logger.warning(f"Skipping page {page_num} due to fetch error")
@@ -269,28 +539,40 @@ class ZorotoAnimeListScraper:
         Returns:
             Complete list of all anime
         """
+        return asyncio.run(self.scrape_all_letters_async(max_pages=max_pages))
+    
+    async def scrape_all_letters_async(self, max_pages: Optional[int] = None) -> List[Dict[str, str]]:
+        """
+        Scrape all letters concurrently over one session.
+        
+        The letters share the session's connections and the request token
+        bucket, so the site sees the same request rate as a single listing.
+        
+        Args:
+            max_pages: Maximum pages per letter
+            
+        Returns:
+            Complete list of all anime, in letter order
+        """
         all_anime = []
         seen_urls = set()
         
         letters = ['.', '0-9'] + [chr(i) for i in range(ord('A'), ord('Z') + 1)]
+        logger.info(f"Scraping anime starting with: {', '.join(letters)}")
         
-        for letter in letters:
-            logger.info(f"\n{'='*50}")
-            logger.info(f"Scraping anime starting with: {letter}")
-            logger.info(f"{'='*50}")
-            
-            anime_list = self.scrape_by_letter(letter, max_pages=max_pages)
-            
-            # Deduplicate
+        async with self.create_session() as session:
+            results = await asyncio.gather(
+                *(self._scrape_pages(session, max_pages, letter) for letter in letters)
+            )
+        
+        # Deduplicate in letter order, so the output matches a letter-by-letter scrape
+        for letter, anime_list in zip(letters, results):
             for anime in anime_list:
                 if anime['url'] not in seen_urls:
                     all_anime.append(anime)
                     seen_urls.add(anime['url'])
             
-            logger.info(f"Total unique anime so far: {len(all_anime)}")
-            
-            # Be respectful with delays between letter categories
-            time.sleep(self.delay * 2)
+            logger.info(f"Letter {letter}: {len(anime_list)} anime, {len(all_anime)} unique so far")
         
         return all_anime
     
@@ -303,8 +585,8 @@ class ZorotoAnimeListScraper:
             filename: Output filename
         """
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(anime_list, f, ensure_ascii=False, indent=2)
+            with open(filename, 'wb') as f:
+                f.write(json_dumps(anime_list, indent=True))
             logger.info(f"Saved {len(anime_list)} anime to {filename}")
         except Exception as e:
             logger.error(f"Error saving to JSON: {e}")
@@ -320,9 +602,10 @@ class ZorotoAnimeListScraper:
         try:
             import csv
             with open(filename, 'w', encoding='utf-8', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=['title', 'url'])
-                writer.writeheader()
-                writer.writerows(anime_list)
+                # Plain rows skip DictWriter's per-row key checks and lookups
+                writer = csv.writer(f)
+                writer.writerow(('title', 'url'))
+                writer.writerows((anime['title'], anime['url']) for anime in anime_list)
             logger.info(f"Saved {len(anime_list)} anime to {filename}")
         except Exception as e:
             logger.error(f"Error saving to CSV: {e}")
@@ -377,6 +660,22 @@ def parse_args():
         default=1.0,
         help='Delay between requests in seconds (default: 1.0)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Maximum number of pages fetched concurrently (default: 8)'
+    )
+    parser.add_argument(
+        '--page-cache',
+        default='zoroto_page_cache.jsonl',
+        help='File caching list pages between runs for conditional requests (default: zoroto_page_cache.jsonl)'
+    )
+    parser.add_argument(
+        '--no-page-cache',
+        action='store_true',
+        help='Always download every list page in full'
+    )
     parser.add_argument(
         '--mode',
         choices=['pagination', 'letters', 'quick'],
@@ -400,7 +699,11 @@ def main():
     logger.info(f"Mode: {args.mode}")
     
     # Initialize scraper
-    scraper = ZorotoAnimeListScraper(delay=args.delay)
+    scraper = ZorotoAnimeListScraper(
+        delay=args.delay,
+        workers=args.workers,
+        page_cache_file=None if args.no_page_cache else args.page_cache
+    )
     
     # Scrape based on mode
     if args.letter:
@@ -408,8 +711,8 @@ def main():
         anime_list = scraper.scrape_by_letter(args.letter, max_pages=args.max_pages)
     elif args.mode == 'quick':
         logger.info("Quick mode: Scraping first page only")
-        soup = scraper.fetch_page()
-        anime_list = scraper.extract_anime_list(soup) if soup else []
+        tree = scraper.fetch_page()
+        anime_list = scraper.extract_anime_list(tree) if tree is not None else []
     elif args.mode == 'letters':
         logger.info("Complete mode: Scraping all letters A-Z, 0-9, and special")
         anime_list = scraper.scrape_all_letters(max_pages=args.max_pages)
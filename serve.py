@@ -9,12 +9,69 @@ Usage:
 """
 
 import http.server
-import socketserver
+import datetime
+import email.utils
+import gzip
+import io
 import os
 import argparse
 import webbrowser
+from functools import lru_cache
+from http import HTTPStatus
 from pathlib import Path
 
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Text files worth compressing; the anime JSON shrinks to about an eighth
+COMPRESSIBLE_SUFFIXES = ('.json', '.js', '.css', '.html', '.txt', '.svg')
+
+
+def accepted_encoding(header: str) -> str:
+    """Pick 'br' or 'gzip' from an Accept-Encoding header ('' for neither)"""
+    accepted = set()
+    for item in header.split(','):
+        coding, _, params = item.partition(';')
+        params = params.replace(' ', '')
+        if params.startswith('q=') and params[2:].strip('0.') == '':
+            continue  # q=0 means "not acceptable"
+        accepted.add(coding.strip().lower())
+    if BROTLI_AVAILABLE and 'br' in accepted:
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return ''
+
+
+# Keyed on mtime and size, so a file rewritten by the scraper is compressed
+# again on its next request; everything else is compressed only once
+@lru_cache(maxsize=1024)
+def compressed_file(path: str, mtime_ns: int, size: int, encoding: str) -> bytes:
+    """Read and compress a file with the given Content-Encoding"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if encoding == 'br':
+        return brotli.compress(data, quality=5)
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+def not_modified_since(header: str, mtime: float) -> bool:
+    """True when an If-Modified-Since date is at or after mtime (same rules as http.server)"""
+    try:
+        since = email.utils.parsedate_to_datetime(header)
+    except (TypeError, IndexError, OverflowError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=datetime.timezone.utc)
+    if since.tzinfo is not datetime.timezone.utc:
+        return False
+    last_modified = datetime.datetime.fromtimestamp(mtime, datetime.timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
 def main():
     parser = argparse.ArgumentParser(description='Serve the anime website')
     parser.add_argument('--port', type=int, default=8000, help='Port to serve on (default: 8000)')
@@ -28,7 +85,12 @@ def main():
     
     # Add CORS headers for local development
     class CORSHandler(Handler):
+        # Set per request by send_head for files that may be sent compressed
+        vary_encoding = False
+        
         def end_headers(self):
+            if self.vary_encoding:
+                self.send_header('Vary', 'Accept-Encoding')
             self.send_header('Access-Control-Allow-Origin', '*')
             self.send_header('Access-Control-Allow-Methods', 'GET')
             self.send_header('Cache-Control', 'no-cache')
@@ -47,8 +109,45 @@ def main():
             # scraped_data paths stay as-is (already correct)
             
             super().do_GET()
+        
+        def send_head(self):
+            # Compressible files go out gzip/brotli-encoded when the browser
+            # accepts it. Every response for them varies on Accept-Encoding,
+            # and If-Modified-Since is checked here so that a file rewritten
+            # by the scraper is sent compressed again, not as a plain 200
+            path = self.translate_path(self.path)
+            self.vary_encoding = path.endswith(COMPRESSIBLE_SUFFIXES)
+            encoding = accepted_encoding(self.headers.get('Accept-Encoding', ''))
+            if not encoding or not self.vary_encoding:
+                return super().send_head()
+            try:
+                st = os.stat(path)
+                # Like http.server, If-None-Match (no ETags are sent) disables the date check
+                if ('If-Modified-Since' in self.headers and 'If-None-Match' not in self.headers
+                        and not_modified_since(self.headers['If-Modified-Since'], st.st_mtime)):
+                    self.send_response(HTTPStatus.NOT_MODIFIED)
+                    self.end_headers()
+                    return None
+                body = compressed_file(path, st.st_mtime_ns, st.st_size, encoding)
+            except OSError:
+                return super().send_head()
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Type', self.guess_type(path))
+            self.send_header('Content-Encoding', encoding)
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+            self.end_headers()
+            return io.BytesIO(body)
+        
+        def copyfile(self, source, outputfile):
+            # socket.sendfile() hands regular files to os.sendfile(), so the kernel
+            # copies them into the socket without a round trip through Python
+            # (directory listings are in-memory and fall back to plain sends)
+            self.connection.sendfile(source)
     
-    with socketserver.TCPServer(("", args.port), CORSHandler) as httpd:
+    # One thread per connection, so the browser loads pages, scripts and
+    # anime JSON in parallel instead of queueing behind each other
+    with http.server.ThreadingHTTPServer(("", args.port), CORSHandler) as httpd:
         url = f"http://localhost:{args.port}"
         print(f"\n🎬 Anime Stream Server")
         print(f"{'='*40}")
@@ -18,27 +18,29 @@ Usage:
 """
 
 import os
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from lxml import etree
 import json
 import time
 import argparse
 import logging
 import re
 import hashlib
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
+from noLLMscraper.data_io import json_dumps, json_loads
+from noLLMscraper.html_utils import has_class, make_url_joiner, own_string, parse_page, visible_text
+
 try:
     import toon
     TOON_AVAILABLE = True
 except ImportError:
     TOON_AVAILABLE = False
 
-
 # =============================================================================
 # CONFIGURATION - Loaded from config.json (single source of truth)
 # =============================================================================
@@ -105,10 +107,103 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used on every scraped page
+_SYNOPSIS_RE = re.compile(r'Synopsis', re.I)
+_EP_URL_NUM_RE = re.compile(r'episode[- _]?(\d+)', re.I)
+_DIGITS_RE = re.compile(r'(\d+)')
+# An embed URL is a whole http(s) URL-like run that names an embed/player
+# path after its first character; matching the run and then checking for the
+# word scans each script once, without backtracking through long runs
+_SCRIPT_URL_RE = re.compile(r'https?://([^"\'<>\s]+)', re.I)
+_EMBED_WORD_RE = re.compile(r'embed|streaming|player|video', re.I)
+_UNSAFE_FN_RE = re.compile(r'[<>:"/\\|?*]')
+
+
+# HTML is parsed straight into lxml trees and queried with compiled XPath, so
+# element matching runs inside libxml2 instead of walking a BeautifulSoup tree.
+# EXSLT regular expressions (re:test) use Python's re module, so they match
+# exactly like the class/href regexes they replace
+_XPATH_NS = {'re': 'http://exslt.org/regular-expressions'}
+
+
+def _xpath(expr: str) -> etree.XPath:
+    """Compile an XPath expression that may use the re: (EXSLT) functions"""
+    return etree.XPath(expr, namespaces=_XPATH_NS)
+
+
+# extract_anime_list: first link of each card (duplicates are returned
+# once, in the order BeautifulSoup's per-item find() met them)
+_BS_CARD_LINKS_XPATH = _xpath(
+    f"//article[{has_class('bs')}]/descendant::div[{has_class('bsx')}][1]/descendant::a[1]"
+)
+_CARD_TITLE_XPATH = _xpath("descendant::*[self::h2 or self::h3 or self::span][1]")
+_GENERIC_CARD_LINKS_XPATH = _xpath(
+    "//*[self::div or self::li][re:test(@class, 'anime|card|item|movie', 'i')]/descendant::a[@href][1]"
+)
+_ANIME_HREF_LINKS_XPATH = _xpath("//a[re:test(@href, '/anime/[^/]+/?$')]")
+
+# extract_anime_details
+_TITLE_XPATHS = tuple(_xpath(f"({expr})[1]") for expr in (
+    f"//h1[{has_class('entry-title')}]", "//h1", f"//*[{has_class('title')}]", f"//*[{has_class('anime-title')}]"
+))
+_ALTER_XPATH = _xpath(f"(//span[{has_class('alter')}])[1]")
+_LD_JSON_XPATH = _xpath("//script[@type = 'application/ld+json']")
+_OG_IMAGE_XPATH = _xpath("(//meta[@property = 'og:image'])[1]")
+_DESC_CONTENT_XPATH = _xpath(f"(//div[{has_class('entry-content')}][@itemprop = 'description'])[1]")
+_ENTRY_CONTENT_XPATH = _xpath(f"(//div[{has_class('entry-content')}])[1]")
+_PARAGRAPHS_XPATH = _xpath(".//p")
+_H2_XPATH = _xpath("//h2")
+# find_next('div'): the next div in document order, which may be inside the h2
+_NEXT_DIV_XPATH = _xpath("(descendant::div | following::div)[1]")
+_SPE_SPANS_XPATH = _xpath(f"(//div[{has_class('spe')}])[1]//span")
+_FIRST_LINK_XPATH = _xpath("(.//a)[1]")
+_LINKS_XPATH = _xpath(".//a")
+_GENXED_LINKS_XPATH = _xpath(f"(//div[{has_class('genxed')}])[1]//a")
+_GENRE_LINKS_XPATH = _xpath("//a[contains(@href, '/genre/')]")
+_EPLISTER_LINKS_XPATH = _xpath(f"(//div[{has_class('eplister')}])[1]//a[@href]")
+_EP_NUM_XPATH = _xpath("descendant::*[self::div or self::span][re:test(@class, 'num|number', 'i')][1]")
+_EP_TITLE_XPATH = _xpath("descendant::*[self::div or self::span][re:test(@class, 'title|name', 'i')][1]")
+_EP_LISTS_XPATH = _xpath("//*[self::ul or self::ol][re:test(@class, 'episode|eps', 'i')]")
+_HREF_LINKS_XPATH = _xpath(".//a[@href]")
+_EP_HREF_LINKS_XPATH = _xpath("//a[re:test(@href, 'episode', 'i')]")
+
+# extract_iframe_urls
+_DATA_SRC_XPATH = _xpath("//*[@data-src]")
+
+# get_max_page_number
+_PAGINATION_XPATH = _xpath(f"(//div[{has_class('pagination')}])[1]")
+_PAGE_LINKS_XPATH = _xpath(f".//a[{has_class('page-numbers')}]")
+_CURRENT_PAGE_XPATH = _xpath(f"(.//span[{has_class('current')}])[1]")
+
+
+def _parse_page(html: str) -> etree._Element:
+    """Parse a page into an lxml tree (an empty page gives an empty <html>)"""
+    # Bytes, because lxml rejects str input that carries an encoding declaration
+    return parse_page(html.encode('utf-8'))
+
+
+def _list_item_links(tree: etree._Element) -> Iterator[etree._Element]:
+    """
+    First link with an href in each <li>, in document order and without duplicates.
+    
+    Same nodes as the XPath //li/descendant::a[@href][1], which is twice as
+    slow because libxml2 merges a node-set per list item. An item's first
+    link never comes after a later item's, so the only duplicates (nested
+    items sharing a first link) are adjacent.
+    """
+    last = None
+    for li in tree.iter('li'):
+        for link in li.iter('a'):
+            if link.get('href') is not None:
+                if link is not last:
+                    yield link
+                    last = link
+                break
+
 
 class SmartHTMLExtractor:
     """
-    Smart HTML extractor using BeautifulSoup with multiple fallback patterns.
+    Smart HTML extractor using lxml and XPath with multiple fallback patterns.
     Handles various HTML structures intelligently.
     """
     
@@ -117,74 +212,70 @@ class SmartHTMLExtractor:
     
     def extract_anime_list(self, html: str, base_url: str) -> List[Dict[str, str]]:
         """Extract anime list from HTML using multiple patterns"""
-        soup = BeautifulSoup(html, 'html.parser')
+        return self.extract_anime_list_tree(_parse_page(html), base_url)
+    
+    def extract_anime_list_tree(self, tree: etree._Element, base_url: str) -> List[Dict[str, str]]:
+        """Extract anime list from a parsed page using multiple patterns"""
+        join = make_url_joiner(base_url)
         anime_list = []
         seen_urls = set()
         
         # Pattern 0: List-mode page (all anime in <ul><li><a> format)
         # This handles /anime/list-mode/ which shows ALL anime on one page
-        for li in soup.find_all('li'):
-            link = li.find('a', href=True)
-            if link:
-                url = link.get('href', '')
-                # Only match actual anime URLs (not categories, genres, etc.)
-                if '/anime/' in url and url.count('/') >= 4:
-                    title = link.get_text(strip=True)
-                    if title and len(title) > 1 and url not in seen_urls:
-                        # Skip navigation/category links
-                        if not any(skip in url.lower() for skip in ['/genre/', '/tag/', '/type/', '/status/', '/list-mode']):
-                            anime_list.append({'title': title, 'url': urljoin(base_url, url)})
-                            seen_urls.add(url)
+        for link in _list_item_links(tree):
+            url = link.get('href', '')
+            # Only match actual anime URLs (not categories, genres, etc.)
+            if '/anime/' in url and url.count('/') >= 4:
+                title = visible_text(link)
+                if title and len(title) > 1 and url not in seen_urls:
+                    # Skip navigation/category links
+                    if not any(skip in url.lower() for skip in ['/genre/', '/tag/', '/type/', '/status/', '/list-mode']):
+                        anime_list.append({'title': title, 'url': join(url)})
+                        seen_urls.add(url)
         
         # If list-mode found anime, return them
         if anime_list:
             return anime_list
         
         # Pattern 1: Article with bs class (zoroto card style)
-        for article in soup.find_all('article', class_='bs'):
-            bsx = article.find('div', class_='bsx')
-            if bsx:
-                link = bsx.find('a')
-                if link:
-                    title = link.get('title') or ''
-                    url = link.get('href', '')
-                    if not title:
-                        h2 = link.find(['h2', 'h3', 'span'])
-                        if h2:
-                            title = h2.get_text(strip=True)
-                    if url and title and url not in seen_urls:
-                        anime_list.append({'title': title, 'url': url})
-                        seen_urls.add(url)
+        for link in _BS_CARD_LINKS_XPATH(tree):
+            title = link.get('title') or ''
+            url = link.get('href', '')
+            if not title:
+                for h2 in _CARD_TITLE_XPATH(link):
+                    title = visible_text(h2)
+            if url and title and url not in seen_urls:
+                anime_list.append({'title': title, 'url': url})
+                seen_urls.add(url)
         
         if anime_list:
             return anime_list
         
         # Pattern 2: Generic anime card divs
-        for card in soup.find_all(['div', 'li'], class_=re.compile(r'anime|card|item|movie', re.I)):
-            link = card.find('a', href=True)
-            if link:
-                url = link.get('href', '')
-                title = link.get('title') or link.get_text(strip=True)
-                if '/anime/' in url and url not in seen_urls and title:
-                    anime_list.append({'title': title, 'url': urljoin(base_url, url)})
-                    seen_urls.add(url)
+        for link in _GENERIC_CARD_LINKS_XPATH(tree):
+            url = link.get('href', '')
+            title = link.get('title') or visible_text(link)
+            if '/anime/' in url and url not in seen_urls and title:
+                anime_list.append({'title': title, 'url': join(url)})
+                seen_urls.add(url)
         
         if anime_list:
             return anime_list
         
         # Pattern 3: Any link with /anime/ in href (fallback)
-        for link in soup.find_all('a', href=re.compile(r'/anime/[^/]+/?$')):
+        for link in _ANIME_HREF_LINKS_XPATH(tree):
             url = link.get('href', '')
-            title = link.get('title') or link.get_text(strip=True)
+            title = link.get('title') or visible_text(link)
             if url not in seen_urls and title and len(title) > 2:
-                anime_list.append({'title': title, 'url': urljoin(base_url, url)})
+                anime_list.append({'title': title, 'url': join(url)})
                 seen_urls.add(url)
         
         return anime_list
     
     def extract_anime_details(self, html: str, base_url: str) -> Dict[str, Any]:
         """Extract anime details and episodes from HTML"""
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = _parse_page(html)
+        join = make_url_joiner(base_url)
         
         result = {
             'title': None,
@@ -204,22 +295,21 @@ class SmartHTMLExtractor:
         }
         
         # Extract title
-        for selector in ['h1.entry-title', 'h1', '.title', '.anime-title']:
-            elem = soup.select_one(selector)
+        for title_xpath in _TITLE_XPATHS:
+            elem = title_xpath(tree)
             if elem:
-                result['title'] = elem.get_text(strip=True)
+                result['title'] = visible_text(elem[0])
                 break
         
         # Extract alternative titles
-        alter_elem = soup.find('span', class_='alter')
+        alter_elem = _ALTER_XPATH(tree)
         if alter_elem:
-            result['alternative_titles'] = alter_elem.get_text(strip=True)
+            result['alternative_titles'] = visible_text(alter_elem[0])
         
         # Extract cover image from JSON-LD schema or meta tags
-        for script in soup.find_all('script', type='application/ld+json'):
+        for script in _LD_JSON_XPATH(tree):
             try:
-                import json
-                data = json.loads(script.string or '{}')
+                data = json.loads(script.text or '{}')
                 if isinstance(data, dict) and '@graph' in data:
                     for item in data['@graph']:
                         if item.get('@type') == 'ImageObject' and item.get('url'):
@@ -232,159 +322,153 @@ class SmartHTMLExtractor:
         
         # Fallback: og:image meta tag
         if not result['cover_image']:
-            og_image = soup.find('meta', property='og:image')
-            if og_image and og_image.get('content'):
-                result['cover_image'] = og_image['content']
+            og_image = _OG_IMAGE_XPATH(tree)
+            if og_image and og_image[0].get('content'):
+                result['cover_image'] = og_image[0].get('content')
         
         # Extract description - prioritize entry-content with itemprop="description"
         # This contains the actual synopsis
-        entry_content = soup.find('div', class_='entry-content', attrs={'itemprop': 'description'})
+        entry_content = _DESC_CONTENT_XPATH(tree)
         if entry_content:
             # Get text from paragraph elements
-            paragraphs = entry_content.find_all('p')
+            paragraphs = _PARAGRAPHS_XPATH(entry_content[0])
             if paragraphs:
-                text = ' '.join(p.get_text(strip=True) for p in paragraphs)
+                text = ' '.join(visible_text(p) for p in paragraphs)
                 if text and 'Watch streaming' not in text and len(text) > 20:
                     result['description'] = text[:1500]
         
         # Fallback: Try entry-content without itemprop
         if not result['description']:
-            entry_content = soup.find('div', class_='entry-content')
+            entry_content = _ENTRY_CONTENT_XPATH(tree)
             if entry_content:
-                text = entry_content.get_text(strip=True)
+                text = visible_text(entry_content[0])
                 if text and 'Watch streaming' not in text and 'Zoro To' not in text and len(text) > 20:
                     result['description'] = text[:1500]
         
         # Fallback: Try synopsis section
         if not result['description']:
-            synopsis = soup.find('h2', string=re.compile(r'Synopsis', re.I))
-            if synopsis:
-                next_div = synopsis.find_next('div')
+            synopsis = next((h2 for h2 in _H2_XPATH(tree) if _SYNOPSIS_RE.search(own_string(h2) or '')), None)
+            if synopsis is not None:
+                next_div = _NEXT_DIV_XPATH(synopsis)
                 if next_div:
-                    text = next_div.get_text(strip=True)
+                    text = visible_text(next_div[0])
                     if text and 'Watch streaming' not in text and len(text) > 20:
                         result['description'] = text[:1500]
         
         # Extract metadata from .spe spans
-        spe_div = soup.find('div', class_='spe')
-        if spe_div:
-            for span in spe_div.find_all('span'):
-                text = span.get_text(strip=True)
-                
-                if 'Status:' in text:
-                    result['status'] = text.replace('Status:', '').strip()
-                
-                elif 'Type:' in text:
-                    result['type'] = text.replace('Type:', '').strip()
-                
-                elif 'Studio:' in text:
-                    studio_link = span.find('a')
-                    if studio_link:
-                        result['studio'] = studio_link.get_text(strip=True)
-                    else:
-                        result['studio'] = text.replace('Studio:', '').strip()
-                
-                elif 'Duration:' in text:
-                    result['duration'] = text.replace('Duration:', '').strip()
-                
-                elif 'Season:' in text:
-                    season_link = span.find('a')
-                    if season_link:
-                        result['season'] = season_link.get_text(strip=True)
-                    else:
-                        result['season'] = text.replace('Season:', '').strip()
-                
-                elif 'Released:' in text:
-                    result['released'] = text.replace('Released:', '').strip()
-                
-                elif 'Producers:' in text:
-                    for link in span.find_all('a'):
-                        producer = link.get_text(strip=True)
-                        if producer and producer not in result['producers']:
-                            result['producers'].append(producer)
+        for span in _SPE_SPANS_XPATH(tree):
+            text = visible_text(span)
+            
+            if 'Status:' in text:
+                result['status'] = text.replace('Status:', '').strip()
+            
+            elif 'Type:' in text:
+                result['type'] = text.replace('Type:', '').strip()
+            
+            elif 'Studio:' in text:
+                studio_link = _FIRST_LINK_XPATH(span)
+                if studio_link:
+                    result['studio'] = visible_text(studio_link[0])
+                else:
+                    result['studio'] = text.replace('Studio:', '').strip()
+            
+            elif 'Duration:' in text:
+                result['duration'] = text.replace('Duration:', '').strip()
+            
+            elif 'Season:' in text:
+                season_link = _FIRST_LINK_XPATH(span)
+                if season_link:
+                    result['season'] = visible_text(season_link[0])
+                else:
+                    result['season'] = text.replace('Season:', '').strip()
+            
+            elif 'Released:' in text:
+                result['released'] = text.replace('Released:', '').strip()
+            
+            elif 'Producers:' in text:
+                for link in _LINKS_XPATH(span):
+                    producer = visible_text(link)
+                    if producer and producer not in result['producers']:
+                        result['producers'].append(producer)
         
         # Extract genres from genxed div
-        genxed = soup.find('div', class_='genxed')
-        if genxed:
-            for link in genxed.find_all('a'):
-                genre = link.get_text(strip=True)
-                if genre and genre not in result['genres']:
-                    result['genres'].append(genre)
+        for link in _GENXED_LINKS_XPATH(tree):
+            genre = visible_text(link)
+            if genre and genre not in result['genres']:
+                result['genres'].append(genre)
         
         # Fallback: Extract genres from any genre links
         if not result['genres']:
-            for link in soup.find_all('a', href=re.compile(r'/genre/')):
-                genre = link.get_text(strip=True)
+            for link in _GENRE_LINKS_XPATH(tree):
+                genre = visible_text(link)
                 if genre and genre not in result['genres']:
                     result['genres'].append(genre)
         
         # Extract episodes - Pattern 1: Episode list container
-        eplister = soup.find('div', class_='eplister')
-        if eplister:
-            for link in eplister.find_all('a', href=True):
-                ep_url = link.get('href')
-                if ep_url:
-                    # Get episode number
-                    ep_num_elem = link.find(['div', 'span'], class_=re.compile(r'num|number', re.I))
-                    ep_num = ep_num_elem.get_text(strip=True) if ep_num_elem else None
-                    
-                    # Get episode title
-                    ep_title_elem = link.find(['div', 'span'], class_=re.compile(r'title|name', re.I))
-                    ep_title = ep_title_elem.get_text(strip=True) if ep_title_elem else None
-                    
-                    if not ep_num:
-                        # Try to extract from URL
-                        match = re.search(r'episode[- _]?(\d+)', ep_url, re.I)
-                        ep_num = match.group(1) if match else str(len(result['episodes']) + 1)
-                    
-                    result['episodes'].append({
-                        'episode_number': ep_num,
-                        'episode_url': urljoin(base_url, ep_url),
-                        'episode_title': ep_title
-                    })
+        for link in _EPLISTER_LINKS_XPATH(tree):
+            ep_url = link.get('href')
+            if ep_url:
+                # Get episode number
+                ep_num_elem = _EP_NUM_XPATH(link)
+                ep_num = visible_text(ep_num_elem[0]) if ep_num_elem else None
+                
+                # Get episode title
+                ep_title_elem = _EP_TITLE_XPATH(link)
+                ep_title = visible_text(ep_title_elem[0]) if ep_title_elem else None
+                
+                if not ep_num:
+                    # Try to extract from URL
+                    match = _EP_URL_NUM_RE.search(ep_url)
+                    ep_num = match.group(1) if match else str(len(result['episodes']) + 1)
+                
+                result['episodes'].append({
+                    'episode_number': ep_num,
+                    'episode_url': join(ep_url),
+                    'episode_title': ep_title
+                })
         
         # Pattern 2: Episode list in ul/ol
         if not result['episodes']:
-            for ul in soup.find_all(['ul', 'ol'], class_=re.compile(r'episode|eps', re.I)):
-                for link in ul.find_all('a', href=True):
+            for ul in _EP_LISTS_XPATH(tree):
+                for link in _HREF_LINKS_XPATH(ul):
                     ep_url = link.get('href')
                     if ep_url and ('episode' in ep_url.lower() or 'ep' in ep_url.lower()):
-                        text = link.get_text(strip=True)
-                        match = re.search(r'(\d+)', text)
+                        text = visible_text(link)
+                        match = _DIGITS_RE.search(text)
                         ep_num = match.group(1) if match else str(len(result['episodes']) + 1)
                         
                         result['episodes'].append({
                             'episode_number': ep_num,
-                            'episode_url': urljoin(base_url, ep_url),
+                            'episode_url': join(ep_url),
                             'episode_title': text if text != ep_num else None
                         })
         
         # Pattern 3: Any links with episode in URL
         if not result['episodes']:
             seen_urls = set()
-            for link in soup.find_all('a', href=re.compile(r'episode', re.I)):
+            for link in _EP_HREF_LINKS_XPATH(tree):
                 ep_url = link.get('href')
                 if ep_url and ep_url not in seen_urls:
                     seen_urls.add(ep_url)
-                    match = re.search(r'episode[- _]?(\d+)', ep_url, re.I)
+                    match = _EP_URL_NUM_RE.search(ep_url)
                     ep_num = match.group(1) if match else str(len(result['episodes']) + 1)
                     
                     result['episodes'].append({
                         'episode_number': ep_num,
-                        'episode_url': urljoin(base_url, ep_url),
-                        'episode_title': link.get_text(strip=True) or None
+                        'episode_url': join(ep_url),
+                        'episode_title': visible_text(link) or None
                     })
         
         return result
     
     def extract_iframe_urls(self, html: str, base_url: str) -> List[str]:
         """Extract iframe/video URLs from episode page"""
-        soup = BeautifulSoup(html, 'html.parser')
+        tree = _parse_page(html)
         urls = []
         seen = set()
         
         # Pattern 1: Direct iframes
-        for iframe in soup.find_all('iframe'):
+        for iframe in tree.iter('iframe'):
             src = iframe.get('src') or iframe.get('data-src') or iframe.get('data-lazy-src')
             if src and src not in seen:
                 full_url = urljoin(base_url, src)
@@ -393,17 +477,19 @@ class SmartHTMLExtractor:
                     seen.add(src)
         
         # Pattern 2: Look for embed URLs in scripts
-        for script in soup.find_all('script'):
-            text = script.string or ''
+        # All scripts are scanned in one pass; the newlines joining them end
+        # any URL run, so no match spans two scripts
+        text = '\n'.join(script.text or '' for script in tree.iter('script'))
+        for match in _SCRIPT_URL_RE.finditer(text):
             # Find URLs that look like video embeds
-            matches = re.findall(r'["\']?(https?://[^"\'<>\s]+(?:embed|streaming|player|video)[^"\'<>\s]*)["\']?', text, re.I)
-            for url in matches:
+            if _EMBED_WORD_RE.search(match.group(1), 1):
+                url = match.group(0)
                 if url not in seen:
                     urls.append(url)
                     seen.add(url)
         
         # Pattern 3: Look for data attributes with URLs
-        for elem in soup.find_all(attrs={'data-src': True}):
+        for elem in _DATA_SRC_XPATH(tree):
             src = elem.get('data-src')
             if src and 'http' in src and src not in seen:
                 urls.append(src)
@@ -427,7 +513,7 @@ class UnifiedFastScraper:
         
         Args:
             output_dir: Base directory for data (will have current/old subdirs)
-            workers: Number of parallel workers
+            workers: Number of anime scraped concurrently
             delay: Delay between requests per worker
             output_format: 'json' or 'toon'
             rotate: Whether to rotate data (old→deleted, current→old, new→current)
@@ -445,17 +531,16 @@ class UnifiedFastScraper:
         # Initialize extractor
         self.extractor = SmartHTMLExtractor()
         
-        # Thread lock for stats
-        self.lock = threading.Lock()
+        # The extractor's parse-and-extract calls run here, leaving the event loop free to fetch
+        self._parse_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix='unified-parse')
         
-        # Statistics
+        # Statistics (only ever touched from the event loop)
         self.stats = {
             'anime_scraped': 0,
             'episodes_found': 0,
             'video_urls_found': 0,
             'failed': 0
         }
-        self.stats_lock = threading.Lock()
     
     def _setup_directories(self):
         """Setup directories with rotation: old→deleted, current→old, new→current"""
@@ -492,42 +577,43 @@ class UnifiedFastScraper:
         
         logger.info(f"Output directory: {self.output_dir}")
     
-    def create_session(self) -> requests.Session:
-        """Create a new HTTP session with larger connection pool"""
-        session = requests.Session()
-        
-        # Increase connection pool size to handle parallel workers
-        # Pool size = WORKERS * EPISODE_WORKERS + buffer
-        pool_size = Config.WORKERS * Config.EPISODE_WORKERS + 10
-        adapter = requests.adapters.HTTPAdapter(
-            pool_connections=pool_size,
-            pool_maxsize=pool_size,
-            max_retries=0  # We handle retries ourselves
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create the HTTP session shared by all workers"""
+        # Size the pool so every episode worker of every anime worker can
+        # hold a keep-alive connection at once
+        # Pool size = workers * EPISODE_WORKERS + buffer
+        pool_size = self.workers * Config.EPISODE_WORKERS + 16
+        connector = aiohttp.TCPConnector(limit=pool_size)
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers={
+                'User-Agent': Config.USER_AGENT,
+                'Accept': Config.ACCEPT,
+                'Accept-Language': Config.ACCEPT_LANGUAGE,
+            },
+            timeout=aiohttp.ClientTimeout(total=Config.REQUEST_TIMEOUT)
         )
-        session.mount('http://', adapter)
-        session.mount('https://', adapter)
-        
-        session.headers.update({
-            'User-Agent': Config.USER_AGENT,
-            'Accept': Config.ACCEPT,
-            'Accept-Language': Config.ACCEPT_LANGUAGE,
-        })
-        return session
     
-    def fetch_page(self, url: str, session: requests.Session) -> Optional[str]:
+    async def fetch_page(self, url: str, session: aiohttp.ClientSession) -> Optional[str]:
         """Fetch a page and return HTML"""
         try:
-            response = session.get(url, timeout=Config.REQUEST_TIMEOUT)
-            response.raise_for_status()
-            return response.text
+            async with session.get(url) as response:
+                response.raise_for_status()
+                # The site is utf-8 when no charset header is sent
+                return (await response.read()).decode(response.charset or 'utf-8', errors='replace')
         except Exception as e:
             logger.debug(f"Error fetching {url}: {e}")
             return None
     
+    async def _in_parse_pool(self, func, *args):
+        """Run a parsing/extraction call in the parse pool"""
+        return await asyncio.get_running_loop().run_in_executor(self._parse_pool, func, *args)
+    
     def sanitize_filename(self, title: str) -> str:
         """Create safe filename from title"""
-        safe = re.sub(r'[<>:"/\\|?*]', '', title)
-        safe = re.sub(r'\s+', '_', safe.strip())
+        # Remove unsafe characters, then strip and join whitespace runs with '_'
+        # (str.split() treats the same characters as whitespace as re's \s)
+        safe = '_'.join(_UNSAFE_FN_RE.sub('', title).split())
         return safe[:200] or "unnamed"
     
     def get_url_hash(self, url: str) -> str:
@@ -536,16 +622,24 @@ class UnifiedFastScraper:
     
     def get_max_page_number(self, html: str) -> int:
         """Detect max page number from pagination"""
-        soup = BeautifulSoup(html, 'html.parser')
+        return self._max_page_number(_parse_page(html))
+    
+    def scan_first_page(self, html: str, url: str) -> Tuple[int, List[Dict[str, str]]]:
+        """Parse a first list page once for both its page count and its anime"""
+        tree = _parse_page(html)
+        return self._max_page_number(tree), self.extractor.extract_anime_list_tree(tree, url)
+    
+    def _max_page_number(self, tree: etree._Element) -> int:
+        """Detect max page number from a parsed page's pagination"""
         max_page = 1
         
-        pagination = soup.find('div', class_='pagination')
+        pagination = _PAGINATION_XPATH(tree)
         if not pagination:
             return 1
         
         # Find all page links
-        for link in pagination.find_all('a', class_='page-numbers'):
-            text = link.get_text(strip=True)
+        for link in _PAGE_LINKS_XPATH(pagination[0]):
+            text = visible_text(link)
             if text.isdigit():
                 max_page = max(max_page, int(text))
             
@@ -560,15 +654,15 @@ class UnifiedFastScraper:
                     pass
         
         # Check current page span
-        current = pagination.find('span', class_='current')
+        current = _CURRENT_PAGE_XPATH(pagination[0])
         if current:
-            text = current.get_text(strip=True)
+            text = visible_text(current[0])
             if text.isdigit():
                 max_page = max(max_page, int(text))
         
         return max_page
     
-    def scrape_anime_list(self, session: requests.Session, mode: str = "quick") -> List[Dict[str, str]]:
+    async def scrape_anime_list(self, session: aiohttp.ClientSession, mode: str = "quick") -> List[Dict[str, str]]:
         """Step 1: Scrape the anime list with FULL pagination"""
         logger.info(f"Step 1: Scraping anime list (mode: {mode})...")
         
@@ -583,9 +677,9 @@ class UnifiedFastScraper:
         if mode == "quick":
             # Quick mode: just first page
             url = f"{base_url}{az_path}"
-            html = self.fetch_page(url, session)
+            html = await self.fetch_page(url, session)
             if html:
-                anime_list = self.extractor.extract_anime_list(html, url)
+                anime_list = await self._in_parse_pool(self.extractor.extract_anime_list, html, url)
                 for anime in anime_list:
                     if anime.get('url') and anime['url'] not in seen_urls:
                         all_anime.append(anime)
@@ -597,16 +691,17 @@ class UnifiedFastScraper:
             
             for letter in letters:
                 first_url = f"{base_url}{az_path}?show={letter}"
-                html = self.fetch_page(first_url, session)
+                html = await self.fetch_page(first_url, session)
                 
                 if not html:
                     continue
                 
-                max_pages = min(self.get_max_page_number(html), Config.MAX_PAGES_PER_LETTER)
+                # Page count and anime from one parse of the first page
+                max_pages, anime_list = await self._in_parse_pool(self.scan_first_page, html, first_url)
+                max_pages = min(max_pages, Config.MAX_PAGES_PER_LETTER)
                 logger.info(f"Fetching letter: {letter} ({max_pages} pages)")
                 
                 # Extract from first page
-                anime_list = self.extractor.extract_anime_list(html, first_url)
                 for anime in anime_list:
                     if anime.get('url') and anime['url'] not in seen_urls:
                         all_anime.append(anime)
@@ -615,12 +710,12 @@ class UnifiedFastScraper:
                 # Fetch remaining pages for this letter
                 for page in range(2, max_pages + 1):
                     page_url = f"{base_url}{az_path}page/{page}/?show={letter}"
-                    html = self.fetch_page(page_url, session)
+                    html = await self.fetch_page(page_url, session)
                     
                     if not html:
                         break
                     
-                    anime_list = self.extractor.extract_anime_list(html, page_url)
+                    anime_list = await self._in_parse_pool(self.extractor.extract_anime_list, html, page_url)
                     if not anime_list:
                         break
                     
@@ -629,22 +724,23 @@ class UnifiedFastScraper:
                             all_anime.append(anime)
                             seen_urls.add(anime['url'])
                     
-                    time.sleep(self.delay)
+                    await asyncio.sleep(self.delay)
                 
                 logger.info(f"  → Total unique anime so far: {len(all_anime)}")
-                time.sleep(self.delay)
+                await asyncio.sleep(self.delay)
         
         else:
             # List-mode: simple pagination (no letters)
             first_url = f"{base_url}{az_path}"
-            html = self.fetch_page(first_url, session)
+            html = await self.fetch_page(first_url, session)
             
             if html:
-                max_pages = min(self.get_max_page_number(html), Config.MAX_PAGES_PER_LETTER)
+                # Page count and anime from one parse of the first page
+                max_pages, anime_list = await self._in_parse_pool(self.scan_first_page, html, first_url)
+                max_pages = min(max_pages, Config.MAX_PAGES_PER_LETTER)
                 logger.info(f"Detected {max_pages} pages to scrape")
                 
                 # Extract from first page
-                anime_list = self.extractor.extract_anime_list(html, first_url)
                 for anime in anime_list:
                     if anime.get('url') and anime['url'] not in seen_urls:
                         all_anime.append(anime)
@@ -655,13 +751,13 @@ class UnifiedFastScraper:
                 # Fetch remaining pages
                 for page in range(2, max_pages + 1):
                     page_url = f"{base_url}{az_path}page/{page}/"
-                    html = self.fetch_page(page_url, session)
+                    html = await self.fetch_page(page_url, session)
                     
                     if not html:
                         logger.warning(f"Page {page} fetch failed, stopping")
                         break
                     
-                    anime_list = self.extractor.extract_anime_list(html, page_url)
+                    anime_list = await self._in_parse_pool(self.extractor.extract_anime_list, html, page_url)
                     if not anime_list:
                         logger.info(f"Page {page} empty, stopping")
                         break
@@ -678,20 +774,20 @@ class UnifiedFastScraper:
                     if new_count == 0:
                         break
                     
-                    time.sleep(self.delay)
+                    await asyncio.sleep(self.delay)
         
         logger.info(f"Total anime found: {len(all_anime)}")
         return all_anime
     
-    def fetch_episode_video(self, ep: Dict[str, Any], session: requests.Session) -> Dict[str, Any]:
+    async def fetch_episode_video(self, ep: Dict[str, Any], session: aiohttp.ClientSession) -> Dict[str, Any]:
         """Fetch video URLs for a single episode (used for parallel processing)"""
         ep_url = ep.get('episode_url')
         iframe_urls = []
         
         if ep_url:
-            ep_html = self.fetch_page(ep_url, session)
+            ep_html = await self.fetch_page(ep_url, session)
             if ep_html:
-                iframe_urls = self.extractor.extract_iframe_urls(ep_html, ep_url)
+                iframe_urls = await self._in_parse_pool(self.extractor.extract_iframe_urls, ep_html, ep_url)
         
         return {
             'episode_number': ep.get('episode_number'),
@@ -701,63 +797,43 @@ class UnifiedFastScraper:
             'has_videos': len(iframe_urls) > 0
         }
     
-    def scrape_single_anime(self, anime: Dict[str, str], session: requests.Session) -> Optional[Dict[str, Any]]:
+    async def scrape_single_anime(self, anime: Dict[str, str], session: aiohttp.ClientSession) -> Optional[Dict[str, Any]]:
         """Steps 2+3: Scrape anime details, episodes, and video URLs (with parallel episode fetching)"""
         url = anime['url']
         title = anime['title']
         
         # Fetch anime page
-        html = self.fetch_page(url, session)
+        html = await self.fetch_page(url, session)
         if not html:
-            with self.stats_lock:
-                self.stats['failed'] += 1
+            self.stats['failed'] += 1
             return None
         
         # Extract details and episodes
-        details = self.extractor.extract_anime_details(html, url)
+        details = await self._in_parse_pool(self.extractor.extract_anime_details, html, url)
         episodes = details.get('episodes', [])[:Config.MAX_EPISODES_PER_ANIME]
         
         # Fetch episodes in PARALLEL (key performance improvement)
         episodes_with_videos = []
         
         if episodes:
-            # Use mini thread pool for episodes within this anime
-            episode_workers = min(Config.EPISODE_WORKERS, len(episodes))
+            # At most EPISODE_WORKERS episodes of this anime in flight
+            ep_sem = asyncio.Semaphore(Config.EPISODE_WORKERS)
             
-            with ThreadPoolExecutor(max_workers=episode_workers) as ep_executor:
-                # Create sessions for episode workers
-                ep_sessions = {}
-                
-                def get_ep_session():
-                    tid = threading.get_ident()
-                    if tid not in ep_sessions:
-                        ep_sessions[tid] = self.create_session()
-                    return ep_sessions[tid]
-                
-                # Submit all episode fetches
-                future_to_ep = {
-                    ep_executor.submit(self.fetch_episode_video, ep, get_ep_session()): ep
-                    for ep in episodes
-                }
-                
-                # Collect results
-                for future in as_completed(future_to_ep):
-                    try:
-                        result = future.result()
-                        episodes_with_videos.append(result)
-                        
-                        with self.stats_lock:
-                            self.stats['video_urls_found'] += len(result.get('video_sources', []))
-                    except Exception:
-                        pass
+            async def fetch_episode(ep):
+                async with ep_sem:
+                    return await self.fetch_episode_video(ep, session)
+            
+            # Collect results (failed episodes are dropped)
+            results = await asyncio.gather(*(fetch_episode(ep) for ep in episodes), return_exceptions=True)
+            episodes_with_videos = [result for result in results if not isinstance(result, Exception)]
         
         # Sort episodes by number
         episodes_with_videos.sort(key=lambda x: int(x.get('episode_number', 0)) if str(x.get('episode_number', '0')).isdigit() else 0)
         
-        # Update stats
-        with self.stats_lock:
-            self.stats['anime_scraped'] += 1
-            self.stats['episodes_found'] += len(episodes_with_videos)
+        # Update stats once per anime
+        self.stats['anime_scraped'] += 1
+        self.stats['episodes_found'] += len(episodes_with_videos)
+        self.stats['video_urls_found'] += sum(len(ep['video_sources']) for ep in episodes_with_videos)
         
         return {
             'title': title,
@@ -792,19 +868,25 @@ class UnifiedFastScraper:
         filepath = self.anime_dir / f"{filename}{ext}"
         
         try:
-            with self.lock:
-                if self.output_format == 'toon' and TOON_AVAILABLE:
-                    toon_str = toon.encode(anime_data)
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        f.write(toon_str)
-                else:
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(anime_data, f, ensure_ascii=False, indent=2)
+            # Each anime has its own {title}_{url hash} file, so writes need no lock
+            if self.output_format == 'toon' and TOON_AVAILABLE:
+                toon_str = toon.encode(anime_data)
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    f.write(toon_str)
+            else:
+                filepath.write_bytes(json_dumps(anime_data, indent=True))
         except Exception as e:
             logger.error(f"Error saving anime data: {e}")
     
     def run(self, mode: str = "quick", limit: Optional[int] = None):
         """Run the complete unified pipeline (always fresh start)."""
+        try:
+            asyncio.run(self.run_async(mode, limit))
+        finally:
+            self._parse_pool.shutdown()
+    
+    async def run_async(self, mode: str = "quick", limit: Optional[int] = None):
+        """Run the pipeline on the event loop, at most ``workers`` anime at a time."""
         start_time = time.time()
         
         logger.info("="*60)
@@ -816,49 +898,47 @@ class UnifiedFastScraper:
         logger.info(f"Rotation: {'enabled' if self.rotate else 'disabled'}")
         logger.info("="*60)
         
-        session = self.create_session()
-        
-        # Step 1: Get anime list
-        anime_list = self.scrape_anime_list(session, mode)
-        
-        if not anime_list:
-            logger.error("No anime found!")
-            return
-        
-        logger.info(f"Total anime found: {len(anime_list)}")
-        
-        # Apply limit: explicit limit > quick mode limit > no limit
-        if limit:
-            anime_list = anime_list[:limit]
-            logger.info(f"Applied explicit limit: {limit}")
-        elif mode == "quick":
-            anime_list = anime_list[:Config.QUICK_LIMIT]
-            logger.info(f"Applied quick mode limit: {Config.QUICK_LIMIT}")
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(self.workers)
         
-        total = len(anime_list)
-        logger.info(f"\nStep 2-3: Scraping {total} anime...")
-        
-        # Process anime in parallel
-        with ThreadPoolExecutor(max_workers=self.workers) as executor:
-            sessions = {}
+        async with self.create_session() as session:
+            # Step 1: Get anime list
+            anime_list = await self.scrape_anime_list(session, mode)
+            
+            if not anime_list:
+                logger.error("No anime found!")
+                return
+            
+            logger.info(f"Total anime found: {len(anime_list)}")
             
-            def get_session():
-                thread_id = threading.get_ident()
-                if thread_id not in sessions:
-                    sessions[thread_id] = self.create_session()
-                return sessions[thread_id]
+            # Apply limit: explicit limit > quick mode limit > no limit
+            if limit:
+                anime_list = anime_list[:limit]
+                logger.info(f"Applied explicit limit: {limit}")
+            elif mode == "quick":
+                anime_list = anime_list[:Config.QUICK_LIMIT]
+                logger.info(f"Applied quick mode limit: {Config.QUICK_LIMIT}")
             
-            future_to_anime = {
-                executor.submit(self.scrape_single_anime, anime, get_session()): anime
-                for anime in anime_list
-            }
+            total = len(anime_list)
+            logger.info(f"\nStep 2-3: Scraping {total} anime...")
             
-            for i, future in enumerate(as_completed(future_to_anime), 1):
-                anime = future_to_anime[future]
+            async def worker(anime):
+                async with sem:
+                    try:
+                        return anime, await self.scrape_single_anime(anime, session), None
+                    except Exception as e:
+                        return anime, None, e
+            
+            # Process anime concurrently, collecting results as they complete
+            tasks = [asyncio.ensure_future(worker(anime)) for anime in anime_list]
+            for i, task in enumerate(asyncio.as_completed(tasks), 1):
+                anime, result, error = await task
                 try:
-                    result = future.result()
+                    if error:
+                        raise error
                     if result:
-                        self.save_anime_data(result)
+                        # File I/O stays off the event loop
+                        await loop.run_in_executor(None, self.save_anime_data, result)
                         
                         logger.info(f"[{i}/{total}] ✓ {anime['title'][:40]} "
                                   f"({result['total_episodes']} eps, "
@@ -897,13 +977,12 @@ class UnifiedFastScraper:
         
         for filepath in anime_files:
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = filepath.read_bytes()
                 
                 if self.output_format == 'toon' and TOON_AVAILABLE:
-                    data = toon.decode(content)
+                    data = toon.decode(content.decode('utf-8'))
                 else:
-                    data = json.loads(content)
+                    data = json_loads(content)
                 
                 all_anime.append({
                     'title': data.get('title'),
@@ -934,11 +1013,10 @@ class UnifiedFastScraper:
         }
         
         index_path = self.output_dir / f"anime_index{ext}"
-        with open(index_path, 'w', encoding='utf-8') as f:
-            if self.output_format == 'toon' and TOON_AVAILABLE:
-                f.write(toon.encode(index))
-            else:
-                json.dump(index, f, ensure_ascii=False, indent=2)
+        if self.output_format == 'toon' and TOON_AVAILABLE:
+            index_path.write_text(toon.encode(index), encoding='utf-8')
+        else:
+            index_path.write_bytes(json_dumps(index, indent=True))
         
         # Save statistics
         stats = {
@@ -949,11 +1027,10 @@ class UnifiedFastScraper:
         }
         
         stats_path = self.output_dir / f"statistics{ext}"
-        with open(stats_path, 'w', encoding='utf-8') as f:
-            if self.output_format == 'toon' and TOON_AVAILABLE:
-                f.write(toon.encode(stats))
-            else:
-                json.dump(stats, f, ensure_ascii=False, indent=2)
+        if self.output_format == 'toon' and TOON_AVAILABLE:
+            stats_path.write_text(toon.encode(stats), encoding='utf-8')
+        else:
+            stats_path.write_bytes(json_dumps(stats, indent=True))
         
         logger.info(f"Created index with {len(all_anime)} anime")
 